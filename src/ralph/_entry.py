@@ -0,0 +1,19 @@
+"""Lightweight console-script entry point for ralph.
+
+Dispatches `ralph --version` without importing click or the command
+graph, so the startup-dominated fast path stays cheap. Everything else
+is handed to the click group in ralph.cli.
+"""
+
+import sys
+
+
+def entry() -> None:
+    """Console-script entry with a --version fast path."""
+    if sys.argv[1:2] == ["--version"]:
+        from ralph import __version__
+        print(f"ralph {__version__}")
+        return
+
+    from ralph.cli import main
+    main()
@@ -1,11 +1,15 @@
 """Archive functions for completed Ralph tasks and state files."""
 
-from datetime import datetime
+import errno
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from ralph import git_utils
-from ralph.debug import debug_log
+from ralph.debug import debug_log, is_debug_enabled
 from ralph.state import (
     DEFAULT_PROGRESS_CONTENT,
     DEFAULT_ACTIVITY_CONTENT,
@@ -13,6 +17,66 @@ from ralph.state import (
 )
 
 
+# State files to archive as (filename, stem, extension, initial content)
+# rows, built once at import so no string splitting or UTF-8 encoding
+# happens per archive. guardrails.md is NOT listed as it contains
+# cross-task learnings.
+_STATE_FILES: Tuple[Tuple[str, str, str, bytes], ...] = (
+    ("progress.md", "progress", "md", DEFAULT_PROGRESS_CONTENT.encode("utf-8")),
+    ("activity.log", "activity", "log", DEFAULT_ACTIVITY_CONTENT.encode("utf-8")),
+    ("errors.log", "errors", "log", DEFAULT_ERRORS_CONTENT.encode("utf-8")),
+)
+
+# Byte sizes of the initial contents - a state file still at its initial
+# size has only boilerplate, so archiving it is a no-op
+_INITIAL_SIZES = {
+    filename: len(initial_bytes)
+    for filename, _, _, initial_bytes in _STATE_FILES
+}
+
+# Cached (epoch_second, formatted) pair - archives landing in the same
+# second reuse the formatted timestamp instead of re-running strftime
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+
+def _archive_timestamp() -> str:
+    """Return the archive timestamp string, cached per epoch second."""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        # time.strftime skips the datetime object allocation
+        _timestamp_cache = (now, time.strftime("%Y%m%d_%H%M%S", time.localtime(now)))
+    return _timestamp_cache[1]
+
+
+# Directories already ensured this process - skips the EEXIST mkdir
+# syscall on repeat archives
+_completed_dirs_created: set = set()
+
+# Single background worker for archive commits, so archival returns to
+# the loop without blocking on a git spawn; one worker keeps commit
+# ordering
+_commit_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _submit_commit(workspace: Path, message: str) -> None:
+    """Queue a commit on the background worker."""
+    global _commit_executor
+    if _commit_executor is None:
+        _commit_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ralph-archive-commit"
+        )
+    _commit_executor.submit(git_utils.commit_changes, workspace, message)
+
+
+def wait_for_pending_commits() -> None:
+    """Block until all queued archive commits have finished."""
+    global _commit_executor
+    if _commit_executor is not None:
+        _commit_executor.shutdown(wait=True)
+        _commit_executor = None
+
+
 def archive_completed_task(workspace: Path) -> Optional[Path]:
     """Archive completed RALPH_TASK.md to .ralph/completed/ with timestamp.
     
@@ -27,92 +91,114 @@ def archive_completed_task(workspace: Path) -> Optional[Path]:
         The path to the archived task file, or None if no task file exists.
         Commits the archive operation to git for state persistence.
     """
+    # One directory read covers the task-file existence probe
+    with os.scandir(workspace) as entries:
+        workspace_names = {entry.name for entry in entries}
+
     task_file = workspace / "RALPH_TASK.md"
-    if not task_file.exists():
+    if "RALPH_TASK.md" not in workspace_names:
         return None
     
-    # Create completed directory if needed
+    # Create completed directory if needed (once per process)
     completed_dir = workspace / ".ralph" / "completed"
-    completed_dir.mkdir(parents=True, exist_ok=True)
+    if completed_dir not in _completed_dirs_created:
+        completed_dir.mkdir(parents=True, exist_ok=True)
+        _completed_dirs_created.add(completed_dir)
     
     # Generate timestamp - used for all archives for correlation
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _archive_timestamp()
     archive_name = f"RALPH_TASK_{timestamp}.md"
     archive_path = completed_dir / archive_name
     
     # Move task file to archive
-    task_file.rename(archive_path)
-    
-    debug_log(
-        "archive.py:archive_completed_task",
-        "Task archived",
-        {"archive_path": str(archive_path)},
-    )
-    
-    # Archive state files with matching timestamp
-    _archive_state_files(workspace, timestamp)
-    
-    # Commit the archive operation to git
-    git_utils.commit_changes(
-        workspace, 
-        f"ralph: archive completed task to {archive_name}"
-    )
-    
+    try:
+        task_file.rename(archive_path)
+    except FileNotFoundError:
+        # completed_dir vanished since it was last ensured - recreate it
+        completed_dir.mkdir(parents=True, exist_ok=True)
+        task_file.rename(archive_path)
+
+    if is_debug_enabled():
+        debug_log(
+            "archive.py:archive_completed_task",
+            "Task archived",
+            {"archive_path": os.fspath(archive_path)},
+        )
+
+    # Archive state files with matching timestamp (completed_dir was
+    # already created above - no need to re-ensure it)
+    _archive_state_files(workspace, timestamp, completed_dir)
+
+    # One commit captures the whole archive transaction; it runs on the
+    # background worker so the caller isn't blocked on the git spawn.
+    # Callers that push or exit afterwards use wait_for_pending_commits.
+    _submit_commit(workspace, f"ralph: archive completed task to {archive_name}")
+
     return archive_path
 
 
-def _archive_state_files(workspace: Path, timestamp: str) -> None:
+def _archive_state_files(workspace: Path, timestamp: str, completed_dir: Path) -> None:
     """Archive state files and reset them to initial state.
     
     Archives progress.md, activity.log, and errors.log to .ralph/completed/
     with the provided timestamp for correlation with the task archive.
-    Then resets each file to its initial empty state.
+    Then resets each file to its initial empty state. Files still at their
+    initial size contain only boilerplate and are skipped.
     
     Note: guardrails.md is NOT archived as it contains cross-task learnings.
     
     Args:
         workspace: Project directory path
         timestamp: Timestamp string to use in archive filenames
+        completed_dir: Archive directory (already created by the caller)
     """
     ralph_dir = workspace / ".ralph"
-    completed_dir = ralph_dir / "completed"
-    completed_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Define state files to archive with their initial content (from state.py)
-    state_files = {
-        "progress.md": DEFAULT_PROGRESS_CONTENT,
-        "activity.log": DEFAULT_ACTIVITY_CONTENT,
-        "errors.log": DEFAULT_ERRORS_CONTENT,
-    }
-    
+
+    # One directory read to check which state files exist (and their
+    # sizes), instead of one exists() stat per file
+    with os.scandir(ralph_dir) as entries:
+        sizes = {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+
     archived_files = []
-    
-    for filename, initial_content in state_files.items():
-        source_file = ralph_dir / filename
-        
-        if source_file.exists():
+
+    for filename, stem, extension, initial_bytes in _STATE_FILES:
+        size = sizes.get(filename)
+        if size is not None and size != _INITIAL_SIZES[filename]:
+            source_file = ralph_dir / filename
+
             # Generate archive name with matching timestamp
-            base_name = filename.rsplit(".", 1)[0]  # e.g., "progress" from "progress.md"
-            extension = filename.rsplit(".", 1)[1]   # e.g., "md" or "log"
-            archive_name = f"{base_name}_{timestamp}.{extension}"
+            archive_name = f"{stem}_{timestamp}.{extension}"
             archive_path = completed_dir / archive_name
-            
-            # Copy content to archive (don't move, we'll reset in place)
-            content = source_file.read_text(encoding="utf-8")
-            archive_path.write_text(content, encoding="utf-8")
-            
-            # Reset to initial state
-            source_file.write_text(initial_content, encoding="utf-8")
-            
+
+            # Move to archive, then seed a fresh file - the archived content
+            # never traverses userspace, unlike a read/write copy
+            try:
+                source_file.rename(archive_path)
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    # Cross-device rename not supported - fall back to copy
+                    shutil.move(str(source_file), str(archive_path))
+                else:
+                    raise
+
+            # Reset to initial state - pre-encoded bytes written through a
+            # raw fd: one open, one write, one close, no codec or buffer
+            fd = os.open(source_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, initial_bytes)
+            finally:
+                os.close(fd)
+
             archived_files.append(archive_name)
-            
-            debug_log(
-                "archive.py:_archive_state_files",
-                f"State file archived and reset: {filename}",
-                {"archive_path": str(archive_path)},
-            )
-    
-    if archived_files:
+
+            if is_debug_enabled():
+                debug_log(
+                    "archive.py:_archive_state_files",
+                    f"State file archived and reset: {filename}",
+                    {"archive_path": os.fspath(archive_path)},
+                )
+    
+    if archived_files and is_debug_enabled():
         debug_log(
             "archive.py:_archive_state_files",
             "State files archived",
@@ -1,30 +1,117 @@
 """CLI entry point for Ralph."""
 
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.traceback import install as install_rich_traceback
 
-from ralph import __version__, git_utils, interview, loop, state, task
-from ralph.debug import setup_logging
-from ralph.ui import THEME
+from ralph import __version__
 
-# Install Rich tracebacks for beautiful error display
-install_rich_traceback(show_locals=False, width=100, word_wrap=True)
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+# Heavy dependencies (rich, ralph submodules) are deferred until a subcommand
+# actually needs them so that `ralph --version` / `--help` don't pay for the
+# full import graph at startup.
+
+_LAZY_SUBMODULES = ("git_utils", "interview", "loop", "state", "task")
+
+# Precompiled patterns and symbol tables for the logs colorizer, shared
+# across every log line instead of being rebuilt per call. The symbol
+# table maps to THEME keys since THEME itself is a deferred import.
+_TIMESTAMP_RE = re.compile(r'^(\[[0-9:]+\])\s*(.*)$')
+_PCT_RE = re.compile(r'\((\d+)%\)')
+
+# One alternation classifies a whole line in a single C-level search; the
+# matched group name selects the style via _LINE_STYLES
+_LINE_RE = re.compile(
+    r"(?P<rule>^(?:═══|Ralph Session))|"
+    r"(?P<session>^SESSION)|"
+    r"(?P<rotate>ROTATE)|(?P<warn>WARN)|"
+    r"(?P<ok>[✓●])|(?P<err>✗)|(?P<warnsym>⚠)"
+)
+_LINE_STYLES = {
+    "rotate": "error",
+    "warn": "warning",
+    "ok": "success",
+    "err": "error",
+    "warnsym": "warning",
+}
+
+# Pre-rendered SGR sequences for the theme colors - log lines are emitted
+# as plain strings written straight to the terminal, skipping a Text
+# allocation and markup parse per line
+_ANSI_RESET = "\x1b[0m"
+_ANSI_CODES = {
+    "yellow": "\x1b[33m",
+    "green": "\x1b[32m",
+    "red": "\x1b[31m",
+    "dim": "\x1b[2m",
+    "magenta": "\x1b[35m",
+    "blue": "\x1b[34m",
+    "bold yellow": "\x1b[1;33m",
+    "bold magenta": "\x1b[1;35m",
+    "italic": "\x1b[3m",
+}
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Create the shared Console on first use (cached per process)."""
+    from rich.console import Console
+    return Console()
+
+
+def __getattr__(name: str):
+    """Lazily resolve heavy module attributes (PEP 562)."""
+    if name == "console":
+        return _console()
+    if name in _LAZY_SUBMODULES:
+        import importlib
+        module = importlib.import_module(f"ralph.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _provider_display_names(providers: list) -> list:
+    """Return user-facing display names for a list of provider instances."""
+    # BaseProvider.__str__ is the display name; map(str, ...) dispatches
+    # through C without a per-element method lookup
+    return list(map(str, providers))
+
+
+def _lazy_excepthook(exc_type, exc, tb) -> None:
+    """Render uncaught exceptions with Rich, importing it only on first use.
+
+    Installing rich.traceback eagerly pulls in rich.syntax/pygments on
+    every invocation; the happy path never raises, so defer those imports
+    to the hook itself.
+    """
+    from rich.console import Console
+    from rich.traceback import Traceback
+
+    Console(stderr=True).print(
+        Traceback.from_exception(
+            exc_type, exc, tb, show_locals=False, width=100, word_wrap=True
+        )
+    )
 
 
 def show_error_panel(title: str, message: str, hint: Optional[str] = None) -> None:
     """Display a styled error panel with optional hint."""
+    from rich.panel import Panel
+    from ralph.theme import THEME
+
+    console = _console()
     content = f"[bold]{message}[/bold]"
     if hint:
         content += f"\n\n[{THEME['muted']}]Hint: {hint}[/]"
-    
+
     console.print()
     console.print(Panel(
         content,
@@ -65,12 +152,22 @@ def main(ctx: click.Context, verbose: bool) -> None:
 
     Runs LLM providers in a loop to complete coding tasks autonomously.
     """
+    from ralph.debug import setup_logging
+
+    # Rich tracebacks for beautiful error display - the hook imports
+    # rich.traceback only if an exception actually escapes
+    sys.excepthook = _lazy_excepthook
+
     # Store verbose flag in context for subcommands
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
-    
-    # Setup logging based on verbose flag
-    setup_logging(verbose=verbose)
+
+    # Setup logging based on verbose flag; RALPH_DEBUG opts in to the
+    # JSON-lines debug file - when unset, debug_log calls short-circuit
+    # before building any payload
+    debug_env = os.environ.get("RALPH_DEBUG")
+    debug_file = Path(debug_env) if debug_env else None
+    setup_logging(verbose=verbose, debug_file=debug_file)
     
     # If no subcommand is given, show help
     if ctx.invoked_subcommand is None:
@@ -152,6 +249,10 @@ def run(
     If RALPH_TASK.md is missing, will interview you to create it.
     Automatically rotates between available providers on failure or gutter.
     """
+    from ralph import git_utils, interview, loop, state, task
+    from ralph.theme import THEME
+
+    console = _console()
     verbose = ctx.obj.get("verbose", False)
     
     # Validate prerequisites
@@ -166,7 +267,7 @@ def run(
     task_file = project_dir / "RALPH_TASK.md"
 
     # Interview user if task file missing
-    if not task_file.exists():
+    if not os.path.isfile(task_file):
         interview.create_task_file(project_dir, initial_instruction=instruction)
 
     # Validate task file
@@ -183,8 +284,8 @@ def run(
     # Initialize .ralph directory
     state.init_ralph_dir(project_dir)
 
-    # Check if already complete
-    completion_status = task.check_completion(task_file)
+    # Check if already complete (precomputed by parse_task_file)
+    completion_status = task_data["completion_status"]
     if completion_status == "COMPLETE":
         console.print("[green]✓[/green] Task already complete! All criteria are checked.")
         sys.exit(0)
@@ -203,28 +304,33 @@ def run(
     from ralph.providers import detect_available_providers
     
     available_providers = detect_available_providers()
-    provider_names = [p.get_display_name() for p in available_providers]
-    
+    provider_names = _provider_display_names(available_providers)
+
     console.print()
     console.print(Rule(f"[bold {THEME['primary']}]Ralph[/]", style=THEME["primary"]))
-    console.print()
-    console.print(f"[{THEME['muted']}]Workspace:[/] {project_dir}")
-    console.print(f"[{THEME['muted']}]Providers:[/] {', '.join(provider_names) if provider_names else 'None'}")
-    console.print(f"[{THEME['muted']}]Max iter:[/]  {iterations}")
+
+    # Build the summary rows up front and emit them in one print - each
+    # console.print parses markup and flushes separately otherwise
+    summary_lines = [
+        "",
+        f"[{THEME['muted']}]Workspace:[/] {project_dir}",
+        f"[{THEME['muted']}]Providers:[/] {', '.join(provider_names) if provider_names else 'None'}",
+        f"[{THEME['muted']}]Max iter:[/]  {iterations}",
+    ]
     if branch:
-        console.print(f"[{THEME['muted']}]Branch:[/]    {branch}")
+        summary_lines.append(f"[{THEME['muted']}]Branch:[/]    {branch}")
     if pr:
-        console.print(f"[{THEME['muted']}]Open PR:[/]   Yes")
+        summary_lines.append(f"[{THEME['muted']}]Open PR:[/]   Yes")
     if once:
-        console.print(f"[{THEME['muted']}]Mode:[/]      Single iteration")
+        summary_lines.append(f"[{THEME['muted']}]Mode:[/]      Single iteration")
     if verbose:
-        console.print(f"[{THEME['muted']}]Verbose:[/]   Yes")
-    console.print()
+        summary_lines.append(f"[{THEME['muted']}]Verbose:[/]   Yes")
+    summary_lines.append("")
+    console.print("\n".join(summary_lines))
 
     # Count criteria
     console.print(Rule("[bold]Progress[/bold]", style=THEME["muted"]))
-    criteria_counts = task.count_criteria(task_file)
-    done, total = criteria_counts
+    done, total = task_data["done"], task_data["total"]
     remaining = total - done
     console.print(f"[{THEME['success'] if done == total else THEME['warning']}]{done} / {total}[/] criteria complete ({remaining} remaining)")
     console.print()
@@ -296,12 +402,14 @@ def status(ctx: click.Context, project_dir: Path) -> None:
     Displays criteria count, completion percentage, and current provider availability.
     """
     from rich.panel import Panel
-    from rich.progress import BarColumn, Progress, TextColumn
     from rich.rule import Rule
     from rich.table import Table
-    
-    from ralph.ui import THEME, get_criteria_list
-    
+
+    from ralph import git_utils, task
+    from ralph.theme import THEME
+
+    console = _console()
+
     # Validate it's a git repo
     if not git_utils.is_git_repo(project_dir):
         console.print(
@@ -312,7 +420,7 @@ def status(ctx: click.Context, project_dir: Path) -> None:
     task_file = project_dir / "RALPH_TASK.md"
 
     # Check if task file exists
-    if not task_file.exists():
+    if not os.path.isfile(task_file):
         console.print(f"[{THEME['warning']}]⚠[/] No RALPH_TASK.md found in {project_dir}")
         console.print(f"Run [bold]ralph run {project_dir}[/bold] to create a task.")
         sys.exit(1)
@@ -330,10 +438,10 @@ def status(ctx: click.Context, project_dir: Path) -> None:
     max_iterations = frontmatter.get("max_iterations", 20)
     test_command = frontmatter.get("test_command", "")
 
-    # Count criteria
-    done, total = task.count_criteria(task_file)
-    completion_status = task.check_completion(task_file)
-    
+    # Criteria counts and status are precomputed by parse_task_file
+    done, total = task_data["done"], task_data["total"]
+    completion_status = task_data["completion_status"]
+
     # Calculate percentage
     if total > 0:
         percentage = (done * 100) // total
@@ -344,7 +452,7 @@ def status(ctx: click.Context, project_dir: Path) -> None:
     from ralph.providers import detect_available_providers
     
     available_providers = detect_available_providers()
-    provider_names = [p.get_display_name() for p in available_providers]
+    provider_names = _provider_display_names(available_providers)
 
     # Print header
     console.print()
@@ -387,22 +495,16 @@ def status(ctx: click.Context, project_dir: Path) -> None:
         else:
             bar_color = THEME["primary"]
         
-        # Create a simple progress bar display
-        progress = Progress(
-            TextColumn("[bold]Progress[/bold]"),
-            BarColumn(bar_width=40, complete_style=bar_color, finished_style=THEME["success"]),
-            TextColumn(f"[{bar_color}]{done}/{total}[/] ({percentage}%)"),
-            console=console,
-            transient=False,
-        )
-        
-        with progress:
-            task_id = progress.add_task("progress", total=total, completed=done)
-        
+        # Draw the bar as a single formatted string - a one-shot status
+        # print doesn't need Rich's live-render machinery
+        filled = (done * 40) // total
+        bar = "█" * filled + "░" * (40 - filled)
+        console.print(f"[bold]Progress[/bold] [{bar_color}]{bar}[/] [{bar_color}]{done}/{total}[/] ({percentage}%)")
+
         console.print()
     
     # Criteria checklist table
-    criteria = get_criteria_list(task_file)
+    criteria = task_data["criteria"]
     if criteria:
         console.print(Rule("[bold]Completion Criteria[/bold]", style=THEME["muted"]))
         console.print()
@@ -455,15 +557,17 @@ def providers(ctx: click.Context) -> None:
     from rich.table import Table
     
     from ralph.providers import detect_available_providers, get_provider_rotation, PROVIDERS
-    from ralph.ui import THEME
-    
+    from ralph.theme import THEME
+
+    console = _console()
+
     console.print()
     console.print(Rule(f"[bold {THEME['primary']}]LLM Providers[/]", style=THEME["primary"]))
     console.print()
     
     # Get all known providers and which are available
     available = detect_available_providers()
-    available_names = {p.get_display_name() for p in available}
+    available_names = set(_provider_display_names(available))
     
     # Get rotation to show current/next
     rotation = None
@@ -473,6 +577,13 @@ def providers(ctx: click.Context) -> None:
         if rotation.providers:
             current = rotation.get_current()
             current_name = current.get_display_name()
+
+    # Precompute rotation position per display name so the loop below
+    # does an O(1) dict lookup instead of rebuilding a list per provider
+    rot_index = {
+        name: i
+        for i, name in enumerate(_provider_display_names(rotation.providers))
+    } if rotation else {}
     
     # Build table
     table = Table(show_header=True, box=None, padding=(0, 2))
@@ -486,9 +597,9 @@ def providers(ctx: click.Context) -> None:
     all_providers = list(PROVIDERS.items())
     
     for cli_name, provider_class in all_providers:
-        provider = provider_class()
-        display_name = provider.get_display_name()
-        
+        # Display names are class attributes - no need to instantiate
+        display_name = provider_class.display_name or cli_name
+
         is_available = display_name in available_names
         is_current = display_name == current_name
         
@@ -507,17 +618,14 @@ def providers(ctx: click.Context) -> None:
             status = f"[{THEME['muted']}]not found[/]"
         
         # Rotation position
-        if is_available and rotation:
-            try:
-                idx = [p.get_display_name() for p in rotation.providers].index(display_name)
-                if is_current:
-                    rotation_text = f"[{THEME['accent']}]current[/]"
-                elif idx == 1:
-                    rotation_text = f"[{THEME['info']}]next[/]"
-                else:
-                    rotation_text = f"[{THEME['muted']}]#{idx + 1}[/]"
-            except ValueError:
-                rotation_text = f"[{THEME['muted']}]-[/]"
+        idx = rot_index.get(display_name) if is_available else None
+        if idx is not None:
+            if is_current:
+                rotation_text = f"[{THEME['accent']}]current[/]"
+            elif idx == 1:
+                rotation_text = f"[{THEME['info']}]next[/]"
+            else:
+                rotation_text = f"[{THEME['muted']}]#{idx + 1}[/]"
         else:
             rotation_text = f"[{THEME['muted']}]-[/]"
         
@@ -567,155 +675,136 @@ def logs(ctx: click.Context, project_dir: Path, errors: bool, lines: int, no_pag
     Shows syntax-highlighted, colorized log output with pagination.
     Use --errors to view errors.log instead of activity.log.
     """
-    import re
+    from collections import deque
+
     from rich.rule import Rule
-    from rich.syntax import Syntax
-    from rich.text import Text
-    
-    from ralph.ui import THEME
-    
+
+    from ralph.theme import THEME
+
+    console = _console()
+
     ralph_dir = project_dir / ".ralph"
-    
-    if not ralph_dir.exists():
+
+    # One directory read answers every log-file existence question,
+    # instead of a stat per probe
+    try:
+        with os.scandir(ralph_dir) as entries:
+            ralph_entries = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
         console.print(f"[{THEME['warning']}]⚠[/] No .ralph directory found in {project_dir}")
         console.print(f"Run [bold]ralph run {project_dir}[/bold] first.")
         sys.exit(1)
-    
+
     log_file = ralph_dir / ("errors.log" if errors else "activity.log")
     log_name = "Errors" if errors else "Activity"
-    
-    if not log_file.exists():
+
+    if log_file.name not in ralph_entries:
         console.print(f"[{THEME['warning']}]⚠[/] No {log_file.name} found")
         sys.exit(1)
     
-    content = log_file.read_text(encoding="utf-8")
-    log_lines = content.splitlines()
-    
-    # Apply --lines limit if specified
+    # With --lines N stream the file and keep only the tail (O(N)
+    # memory); otherwise bulk-read bytes and decode in one shot, which
+    # skips the text io stack's incremental decoder and newline
+    # translation
     if lines is not None and lines > 0:
-        log_lines = log_lines[-lines:]
-    
-    # Color mapping for log levels (using Unicode symbols and text patterns)
-    level_colors = {
-        "●": THEME["success"],  # Will be colored based on context
-        "✓": THEME["success"],
-        "✗": THEME["error"],
-        "⚠": THEME["warning"],
-        "ROTATE": THEME["error"],
-        "WARN": THEME["warning"],
-    }
+        with log_file.open("r", encoding="utf-8") as f:
+            log_lines = [line.rstrip("\n") for line in deque(f, maxlen=lines)]
+    else:
+        log_lines = log_file.read_bytes().decode("utf-8", "replace").splitlines()
+
+    # Piped output (ralph logs proj | grep ...) doesn't need markup,
+    # width computation, or paging - dump plain text and return
+    if not console.is_terminal:
+        sys.stdout.writelines(line + "\n" for line in log_lines)
+        return
     
-    def colorize_line(line: str) -> Text:
-        """Apply colors based on log level indicators."""
-        text = Text()
-        
+    muted_code = _ANSI_CODES[THEME["muted"]]
+
+    def colorize_line(line: str) -> str:
+        """Return the line pre-rendered as an ANSI string."""
+        prefix = ""
+
         # Check for timestamp pattern [HH:MM:SS]
-        timestamp_match = re.match(r'^(\[[0-9:]+\])\s*(.*)$', line)
+        timestamp_match = _TIMESTAMP_RE.match(line)
         if timestamp_match:
             timestamp, rest = timestamp_match.groups()
-            text.append(timestamp, style=THEME["muted"])
-            text.append(" ")
+            prefix = f"{muted_code}{timestamp}{_ANSI_RESET} "
             line = rest
-        
-        # Check for session markers
-        if line.startswith("═══") or line.startswith("Ralph Session"):
-            text.append(line, style=f"bold {THEME['primary']}")
-            return text
-        
-        if line.startswith("SESSION"):
-            text.append(line, style=f"bold {THEME['accent']}")
-            return text
-        
-        # Check for symbols and color accordingly
-        found_color = None
-        for symbol, color in level_colors.items():
-            if symbol in line:
-                found_color = color
-                break
-        
-        # Special handling for ● symbol - check context to determine color
-        if "●" in line:
-            # Determine color based on surrounding context
-            if "TOKENS" in line:
-                # Token status line - check percentage
-                import re
-                pct_match = re.search(r'\((\d+)%\)', line)
-                if pct_match:
-                    pct = int(pct_match.group(1))
-                    if pct < 60:
-                        found_color = THEME["success"]
-                    elif pct < 80:
-                        found_color = THEME["warning"]
-                    else:
-                        found_color = THEME["error"]
+
+        # Classify the line with one regex search; the matched group name
+        # picks the style
+        match = _LINE_RE.search(line)
+        if not match:
+            return prefix + line
+
+        group = match.lastgroup
+
+        # Session markers take the whole line
+        if group == "rule":
+            return f"{prefix}{_ANSI_CODES['bold ' + THEME['primary']]}{line}{_ANSI_RESET}"
+        if group == "session":
+            return f"{prefix}{_ANSI_CODES['bold ' + THEME['accent']]}{line}{_ANSI_RESET}"
+
+        found_color = THEME[_LINE_STYLES[group]]
+
+        # Special handling for ● token-status lines - color by
+        # percentage from the surrounding context
+        if group == "ok" and "TOKENS" in line:
+            pct_match = _PCT_RE.search(line)
+            if pct_match:
+                pct = int(pct_match.group(1))
+                if pct < 60:
+                    found_color = THEME["success"]
+                elif pct < 80:
+                    found_color = THEME["warning"]
                 else:
-                    found_color = THEME["success"]  # Default to green
-            else:
-                # Other uses - default to success
-                found_color = THEME["success"]
-        
-        # Check for ROTATE/WARN keywords
-        if "ROTATE" in line:
-            found_color = THEME["error"]
-        elif "WARN" in line:
-            found_color = THEME["warning"]
-        
-        if found_color:
-            text.append(line, style=found_color)
-        else:
-            text.append(line)
-        
-        return text
-    
-    def render_log_output():
-        """Render the log output with colors."""
-        # Print header
-        console.print()
-        console.print(Rule(f"[bold {THEME['primary']}]{log_name} Log[/]", style=THEME["primary"]))
-        console.print(f"[{THEME['muted']}]{log_file}[/]")
-        console.print()
-        
+                    found_color = THEME["error"]
+
+        return f"{prefix}{_ANSI_CODES[found_color]}{line}{_ANSI_RESET}"
+
+    def render_log_lines():
+        """Yield pre-rendered ANSI lines for the log body."""
         # Pattern to detect code blocks or shell commands with multi-line output
         in_code_block = False
-        code_lines = []
-        
+
         for line in log_lines:
-            # Skip markdown headers in the log file
+            # Markdown headers in the log file
             if line.startswith("#") or line.startswith(">"):
-                console.print(Text(line, style=THEME["muted"]))
-                continue
-            
+                yield f"{muted_code}{line}{_ANSI_RESET}"
             # Empty lines
-            if not line.strip():
-                console.print()
-                continue
-            
+            elif not line.strip():
+                yield ""
             # Check for multi-line shell output (heredoc in commit messages)
-            if "<<'EOF'" in line or "<<EOF" in line:
+            elif "<<'EOF'" in line or "<<EOF" in line:
                 in_code_block = True
-                console.print(colorize_line(line))
-                continue
-            
-            if in_code_block:
+                yield colorize_line(line)
+            elif in_code_block:
                 if line.strip() == "EOF" or line.endswith("EOF"):
                     in_code_block = False
-                    console.print(Text(line, style=THEME["muted"]))
+                    yield f"{muted_code}{line}{_ANSI_RESET}"
                 else:
                     # Show code in code block style
-                    console.print(Text(f"  {line}", style="italic"))
-                continue
-            
-            # Regular log line
-            console.print(colorize_line(line))
-        
-        console.print()
-    
-    # Use pager for long output
+                    yield f"  {_ANSI_CODES['italic']}{line}{_ANSI_RESET}"
+            else:
+                # Regular log line
+                yield colorize_line(line)
+
+    # Print header
+    console.print()
+    console.print(Rule(f"[bold {THEME['primary']}]{log_name} Log[/]", style=THEME["primary"]))
+    console.print(f"[{THEME['muted']}]{log_file}[/]")
+    console.print()
+
+    body = "\n".join(render_log_lines()) + "\n"
+
+    # Use pager for long output; click's pager keeps ANSI colors (less -R)
+    # when color=True
     if no_pager or len(log_lines) < 50:
-        render_log_output()
+        console.file.write(body)
     else:
-        with console.pager(styles=True):
-            render_log_output()
+        click.echo_via_pager(body, color=True)
+
+    console.print()
 
 
 if __name__ == "__main__":
@@ -4,16 +4,51 @@ Provides configurable logging using Python's standard logging module.
 Replaces hardcoded debug log paths with proper configurable logging.
 """
 
+import atexit
 import json
 import logging
+import queue
 import time
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-# Module-level logger
-_logger: Optional[logging.Logger] = None
-_verbose: bool = False
-_debug_file: Optional[Path] = None
+try:
+    # Optional speedup for the JSON-lines debug file; stdlib json is the
+    # fallback when orjson isn't installed
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass(frozen=True, slots=True)
+class _DebugConfig:
+    """Immutable logging configuration.
+
+    Bundling logger/verbose/debug_file means hot paths read one global
+    and three slot attributes instead of three separate module globals.
+    """
+
+    logger: logging.Logger
+    verbose: bool
+    debug_file: Optional[Path]
+
+
+_cfg: Optional[_DebugConfig] = None
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Stop the queue listener, flushing any buffered records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Flush queued debug records at interpreter shutdown
+atexit.register(_stop_listener)
 
 
 def setup_logging(
@@ -22,32 +57,32 @@ def setup_logging(
     log_level: int = logging.INFO,
 ) -> logging.Logger:
     """Configure the Ralph logger.
-    
+
     Args:
         verbose: Enable verbose console output
         debug_file: Optional file path for debug log output (JSON lines format)
         log_level: Logging level for console output
-        
+
     Returns:
         Configured logger instance
     """
-    global _logger, _verbose, _debug_file
-    
-    _verbose = verbose
-    _debug_file = debug_file
-    
+    global _cfg, _listener
+
+    # Stop any listener left over from a previous setup call
+    _stop_listener()
+
     # Create or get logger
     logger = logging.getLogger("ralph")
     logger.setLevel(logging.DEBUG)  # Capture all, filter at handler level
-    
+
     # Clear existing handlers
     logger.handlers.clear()
-    
+
     # Console handler
     console_handler = logging.StreamHandler()
     console_level = logging.DEBUG if verbose else log_level
     console_handler.setLevel(console_level)
-    
+
     # Format: simple for normal, detailed for verbose
     if verbose:
         console_format = logging.Formatter(
@@ -56,28 +91,33 @@ def setup_logging(
         )
     else:
         console_format = logging.Formatter("%(message)s")
-    
+
     console_handler.setFormatter(console_format)
     logger.addHandler(console_handler)
-    
-    # File handler if debug file specified
+
+    # File handler if debug file specified. Writes go through a queue
+    # drained by a background thread, so the hot path enqueues in O(1)
+    # instead of blocking on disk I/O per log call.
     if debug_file:
         debug_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(debug_file, encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(logging.Formatter("%(message)s"))
-        logger.addHandler(file_handler)
-    
-    _logger = logger
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, file_handler)
+        _listener.start()
+
+    _cfg = _DebugConfig(logger=logger, verbose=verbose, debug_file=debug_file)
     return logger
 
 
 def get_logger() -> logging.Logger:
     """Get the Ralph logger, creating with defaults if not configured."""
-    global _logger
-    if _logger is None:
-        _logger = setup_logging()
-    return _logger
+    if _cfg is None:
+        return setup_logging()
+    return _cfg.logger
 
 
 def debug_log(
@@ -87,36 +127,57 @@ def debug_log(
     hypothesis_id: str = "A",
 ) -> None:
     """Write structured debug log entry.
-    
+
     This function maintains backward compatibility with the old _debug_log
     function signature while using proper Python logging.
-    
+
     Args:
         location: Code location (e.g., "loop.py:178")
         message: Human-readable message
         data: Optional structured data dictionary
         hypothesis_id: Debug tracking ID
     """
-    logger = get_logger()
-    
-    # Build structured log entry
-    log_entry = {
-        "location": location,
-        "message": message,
-        "data": data or {},
-        "hypothesisId": hypothesis_id,
-        "timestamp": int(time.time() * 1000),
-    }
-    
+    cfg = _cfg
+    if cfg is None:
+        setup_logging()
+        cfg = _cfg
+
+    # Nothing would be emitted - skip the dict build and serialization
+    if not cfg.debug_file and not cfg.verbose:
+        return
+
+    # Also respect externally-raised logger levels (isDebugEnabled idiom)
+    if not cfg.logger.isEnabledFor(logging.DEBUG):
+        return
+
     # Log as JSON if file logging enabled, otherwise as formatted string
-    if _debug_file:
-        logger.debug(json.dumps(log_entry))
-    elif _verbose:
+    if cfg.debug_file:
+        log_entry = {
+            "location": location,
+            "message": message,
+            "data": data or {},
+            "hypothesisId": hypothesis_id,
+            "timestamp": int(time.time() * 1000),
+        }
+        if orjson is not None:
+            cfg.logger.debug(orjson.dumps(log_entry).decode())
+        else:
+            cfg.logger.debug(json.dumps(log_entry))
+    else:
         # Formatted debug output for console
         data_str = f" | {data}" if data else ""
-        logger.debug(f"[{location}] {message}{data_str}")
+        cfg.logger.debug(f"[{location}] {message}{data_str}")
 
 
 def is_verbose() -> bool:
     """Check if verbose mode is enabled."""
-    return _verbose
+    return _cfg.verbose if _cfg is not None else False
+
+
+def is_debug_enabled() -> bool:
+    """Check if debug_log output would actually be emitted.
+
+    Callers on hot paths can guard debug_log calls with this to skip
+    building payload dicts when neither file nor verbose logging is on.
+    """
+    return _cfg is not None and (_cfg.verbose or _cfg.debug_file is not None)
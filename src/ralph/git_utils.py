@@ -1,10 +1,13 @@
 """Git utilities for Ralph."""
 
+import asyncio
 import logging
+import os
 import subprocess
-import time
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 logger = logging.getLogger("ralph")
 
@@ -12,40 +15,62 @@ logger = logging.getLogger("ralph")
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1  # seconds
 
+# Set via cancel_git_retries() (e.g. from a signal handler) to abort an
+# in-progress retry backoff instead of sleeping it out
+_cancel_event = threading.Event()
+
+
+def cancel_git_retries() -> None:
+    """Cancel any in-progress git retry backoff immediately."""
+    _cancel_event.set()
+
 
 def _run_git_with_retry(
     args: list[str],
-    cwd: str,
-    capture_output: bool = True,
+    cwd: Optional[str] = None,
+    capture_output: bool = False,
     check: bool = True,
     text: bool = False,
 ) -> subprocess.CompletedProcess:
     """Run a git command with retry logic and exponential backoff.
-    
+
     Args:
         args: Command arguments (e.g., ["git", "-C", "/path", "status"])
-        cwd: Working directory
-        capture_output: Capture stdout/stderr
+        cwd: Working directory (None to inherit; "git -C" already
+            points git at the right repository)
+        capture_output: Capture stdout/stderr; when False the output is
+            discarded via DEVNULL, skipping pipe setup for callers that
+            never read it
         check: Raise exception on non-zero exit
         text: Return output as text instead of bytes
-        
+
     Returns:
         CompletedProcess result
-        
+
     Raises:
         subprocess.CalledProcessError: If command fails after all retries
     """
     last_exception = None
-    
+
     for attempt in range(MAX_RETRIES):
         try:
-            result = subprocess.run(
-                args,
-                capture_output=capture_output,
-                check=check,
-                text=text,
-                cwd=cwd,
-            )
+            if capture_output:
+                result = subprocess.run(
+                    args,
+                    capture_output=True,
+                    check=check,
+                    text=text,
+                    cwd=cwd,
+                )
+            else:
+                result = subprocess.run(
+                    args,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=check,
+                    text=text,
+                    cwd=cwd,
+                )
             return result
         except subprocess.CalledProcessError as e:
             last_exception = e
@@ -55,7 +80,10 @@ def _run_git_with_retry(
                     f"Git command failed (attempt {attempt + 1}/{MAX_RETRIES}), "
                     f"retrying in {backoff}s: {' '.join(args)}"
                 )
-                time.sleep(backoff)
+                # Event.wait is interruptible, unlike time.sleep - a
+                # cancellation aborts the backoff immediately
+                if _cancel_event.wait(backoff):
+                    raise KeyboardInterrupt("git retry cancelled")
             else:
                 logger.debug(
                     f"Git command failed after {MAX_RETRIES} attempts: {' '.join(args)}"
@@ -69,80 +97,220 @@ def _run_git_with_retry(
     raise RuntimeError("Unexpected state in git retry logic")
 
 
-def is_git_repo(directory: Path) -> bool:
-    """Check if directory is a git repository."""
+async def _run_git_with_retry_async(
+    args: list[str],
+    cwd: Optional[str] = None,
+) -> subprocess.CompletedProcess:
+    """Async counterpart of _run_git_with_retry.
+
+    Uses asyncio subprocesses so callers can overlap git operations with
+    other I/O (e.g. LLM streaming) instead of blocking on fork+exec, and
+    issue independent calls concurrently via asyncio.gather.
+
+    Args:
+        args: Command arguments (e.g., ["git", "-C", "/path", "status"])
+        cwd: Working directory (None to inherit; "git -C" already points
+            git at the right repository)
+
+    Returns:
+        CompletedProcess result
+
+    Raises:
+        subprocess.CalledProcessError: If command fails after all retries
+    """
+    last_exception = None
+
+    for attempt in range(MAX_RETRIES):
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
+        stdout, stderr = await proc.communicate()
+        if proc.returncode == 0:
+            return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+
+        # Synthesize CalledProcessError to match the sync helper's semantics
+        last_exception = subprocess.CalledProcessError(
+            proc.returncode, args, stdout, stderr
+        )
+        if attempt < MAX_RETRIES - 1:
+            backoff = INITIAL_BACKOFF * (2 ** attempt)
+            logger.debug(
+                f"Git command failed (attempt {attempt + 1}/{MAX_RETRIES}), "
+                f"retrying in {backoff}s: {' '.join(args)}"
+            )
+            await asyncio.sleep(backoff)
+        else:
+            logger.debug(
+                f"Git command failed after {MAX_RETRIES} attempts: {' '.join(args)}"
+            )
+
+    raise last_exception
+
+
+async def commit_changes_async(directory: Path, message: str) -> None:
+    """Async variant of commit_changes for event-loop callers."""
+    d = str(directory)
     try:
-        result = subprocess.run(
-            ["git", "-C", str(directory), "rev-parse", "--git-dir"],
-            capture_output=True,
-            check=True,
+        await _run_git_with_retry_async(["git", "-C", d, "add", "-A"])
+        await _run_git_with_retry_async(["git", "-C", d, "commit", "-m", message])
+    except subprocess.CalledProcessError:
+        # Ignore if nothing to commit
+        pass
+
+
+async def has_uncommitted_changes_async(directory: Path) -> bool:
+    """Async variant of has_uncommitted_changes for event-loop callers."""
+    try:
+        result = await _run_git_with_retry_async(
+            ["git", "-C", str(directory), "status", "--porcelain"],
         )
-        return result.returncode == 0
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        return bool(result.stdout.strip())
+    except subprocess.CalledProcessError:
         return False
 
 
+@lru_cache(maxsize=32)
+def _is_git_repo_cached(directory: str) -> bool:
+    """Cached backend for is_git_repo, keyed by resolved directory path."""
+    if os.environ.get("RALPH_STRICT_GIT_CHECK") == "1":
+        # Strict mode: let git itself decide (spawns a subprocess)
+        try:
+            # Only the exit status matters - discard the output
+            result = subprocess.run(
+                ["git", "-C", directory, "rev-parse", "--git-dir"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+            return result.returncode == 0
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return False
+
+    # Filesystem heuristic: .git entry (directory, or file for worktrees)
+    # covers normal repos; objects/ + refs/ covers bare repositories
+    path = Path(directory)
+    if (path / ".git").exists():
+        return True
+    return (path / "objects").is_dir() and (path / "refs").is_dir()
+
+
+def is_git_repo(directory: Path) -> bool:
+    """Check if directory is a git repository.
+
+    Uses a couple of stat calls instead of spawning git; set
+    RALPH_STRICT_GIT_CHECK=1 to restore the subprocess-based check.
+    Results are cached per resolved path for the lifetime of the process.
+    """
+    return _is_git_repo_cached(str(Path(directory).resolve()))
+
+
 def create_branch(directory: Path, branch_name: str) -> None:
     """Create and checkout a new branch."""
+    # Convert the path once; "-C" makes a separate cwd redundant
+    d = str(directory)
     try:
         # Try to create branch with retry
-        _run_git_with_retry(
-            ["git", "-C", str(directory), "checkout", "-b", branch_name],
-            cwd=str(directory),
-        )
+        _run_git_with_retry(["git", "-C", d, "checkout", "-b", branch_name])
     except subprocess.CalledProcessError:
         # Branch might already exist, try to checkout
-        _run_git_with_retry(
-            ["git", "-C", str(directory), "checkout", branch_name],
-            cwd=str(directory),
-        )
+        _run_git_with_retry(["git", "-C", d, "checkout", branch_name])
 
 
 def commit_changes(directory: Path, message: str) -> None:
     """Commit all changes with given message."""
+    d = str(directory)
     try:
         # Stage all changes with retry
-        _run_git_with_retry(
-            ["git", "-C", str(directory), "add", "-A"],
-            cwd=str(directory),
-        )
+        _run_git_with_retry(["git", "-C", d, "add", "-A"])
         # Commit with retry
-        _run_git_with_retry(
-            ["git", "-C", str(directory), "commit", "-m", message],
-            cwd=str(directory),
-        )
+        _run_git_with_retry(["git", "-C", d, "commit", "-m", message])
     except subprocess.CalledProcessError:
         # Ignore if nothing to commit
         pass
 
 
-def has_uncommitted_changes(directory: Path) -> bool:
-    """Check if there are uncommitted changes."""
+class CommitBatcher:
+    """Accumulate commit messages and issue a single commit on exit.
+
+    Several steps of a larger operation (e.g. archiving a task plus its
+    state files) would otherwise each spawn git add/commit; batching them
+    collapses N subprocess spawns into one commit that captures the whole
+    transaction.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.messages: list[str] = []
+
+    def add(self, message: str) -> None:
+        """Queue a message to include in the batched commit."""
+        self.messages.append(message)
+
+    def flush(self) -> None:
+        """Issue one commit covering all queued messages, if any."""
+        if self.messages:
+            commit_changes(self.directory, "\n".join(self.messages))
+            self.messages.clear()
+
+    def __enter__(self) -> "CommitBatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
+
+
+class RepoState(NamedTuple):
+    """Snapshot of repository state from a single git invocation."""
+
+    is_repo: bool
+    branch: Optional[str]
+    has_changes: bool
+
+
+def get_repo_state(directory: Path) -> RepoState:
+    """Read repo validity, current branch, and dirty flag in one git call.
+
+    Callers needing several of these facts would otherwise spawn one git
+    process per query; `git status --porcelain=v2 --branch` answers them
+    all in a single invocation.
+    """
     try:
         result = subprocess.run(
-            ["git", "-C", str(directory), "status", "--porcelain"],
+            ["git", "-C", str(directory), "status", "--porcelain=v2", "--branch"],
             capture_output=True,
             text=True,
             check=True,
         )
-        return bool(result.stdout.strip())
-    except subprocess.CalledProcessError:
-        return False
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return RepoState(is_repo=False, branch=None, has_changes=False)
+
+    branch = None
+    has_changes = False
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.head"):
+            branch = line.rsplit(" ", 1)[-1]
+        elif line[:1] in ("1", "2", "u", "?"):
+            # Changed, renamed, unmerged, or untracked entry
+            has_changes = True
+    return RepoState(is_repo=True, branch=branch, has_changes=has_changes)
+
+
+def has_uncommitted_changes(directory: Path) -> bool:
+    """Check if there are uncommitted changes."""
+    return get_repo_state(directory).has_changes
 
 
 def push_branch(directory: Path, branch_name: Optional[str] = None) -> None:
     """Push current branch to remote."""
+    d = str(directory)
     try:
         if branch_name:
-            _run_git_with_retry(
-                ["git", "-C", str(directory), "push", "-u", "origin", branch_name],
-                cwd=str(directory),
-            )
+            _run_git_with_retry(["git", "-C", d, "push", "-u", "origin", branch_name])
         else:
-            _run_git_with_retry(
-                ["git", "-C", str(directory), "push"],
-                cwd=str(directory),
-            )
+            _run_git_with_retry(["git", "-C", d, "push"])
     except subprocess.CalledProcessError:
         # Ignore if push fails (no remote, etc.)
         logger.debug(f"Push failed for {directory}")
@@ -155,7 +323,8 @@ def open_pr(directory: Path, branch_name: str) -> None:
             ["gh", "pr", "create", "--fill"],
             cwd=str(directory),
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
     except (subprocess.CalledProcessError, FileNotFoundError):
         # gh CLI not available or failed
@@ -1,8 +1,8 @@
 """Gutter detection for Ralph."""
 
 import time
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from collections import defaultdict, deque
+from typing import Deque, Dict
 
 
 class GutterDetector:
@@ -10,14 +10,21 @@ class GutterDetector:
 
     def __init__(self):
         self.failures: Dict[str, int] = defaultdict(int)
-        self.writes: List[Tuple[int, str]] = []  # (timestamp, filepath)
+        # Per-file write timestamps; appending to and expiring from a
+        # deque keeps track_write amortized O(1) instead of rescanning a
+        # global list on every call
+        self.writes: Dict[str, Deque[int]] = defaultdict(deque)
+        self._writes_since_gc = 0
 
     def track_failure(self, command: str, exit_code: int) -> bool:
         """Track shell command failure. Returns True if gutter detected."""
         if exit_code != 0:
-            self.failures[command] += 1
             count = self.failures[command]
-            
+            if count >= 3:
+                return True  # Already guttered - skip the increment
+            count += 1
+            self.failures[command] = count
+
             if count >= 3:
                 return True  # Gutter: same command failed 3x
         return False
@@ -25,16 +32,25 @@ class GutterDetector:
     def track_write(self, filepath: str) -> bool:
         """Track file write. Returns True if gutter detected."""
         now = int(time.time())
-        self.writes.append((now, filepath))
-
-        # Remove writes older than 10 minutes
         cutoff = now - 600
-        self.writes = [(ts, path) for ts, path in self.writes if ts >= cutoff]
 
-        # Count writes to this file in last 10 minutes
-        count = sum(1 for ts, path in self.writes if path == filepath)
+        window = self.writes[filepath]
+        window.append(now)
+
+        # Remove writes older than 10 minutes for this file
+        while window and window[0] < cutoff:
+            window.popleft()
+
+        # Occasionally drop files whose windows have fully expired so the
+        # key set doesn't grow without bound over a long session
+        self._writes_since_gc += 1
+        if self._writes_since_gc >= 256:
+            self._writes_since_gc = 0
+            expired = [path for path, w in self.writes.items() if not w or w[-1] < cutoff]
+            for path in expired:
+                del self.writes[path]
 
-        if count >= 5:
+        if len(window) >= 5:
             return True  # Gutter: same file written 5x in 10 min
 
         return False
@@ -1,50 +1,115 @@
 """LLM-based interview to create RALPH_TASK.md."""
 
-import json
-import subprocess
-import sys
-import threading
-import time
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.rule import Rule
 
-from ralph.providers import get_provider_rotation
-from ralph.signals import TAG_DONE
-from ralph.ui import THEME
+from ralph.theme import THEME
 
 console = Console()
 
-
-def analyze_project_context(project_dir: Path) -> str:
-    """Analyze project directory to understand context."""
+# Project files worth surfacing in the interview context; a frozenset so
+# membership checks during the directory walk are O(1)
+_KEY_FILENAMES = frozenset({
+    "package.json",
+    "pyproject.toml",
+    "requirements.txt",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "Makefile",
+    "README.md",
+})
+
+
+@lru_cache(maxsize=4)
+def _analyze_cached(project_dir_str: str, dir_mtime_ns: int) -> str:
+    """Build the project context string, cached by directory mtime."""
+    project_dir = Path(project_dir_str)
     context_lines = []
-    
-    # List important files
+
+    # One directory walk collects both the key files and the top-level
+    # directories, instead of an existence probe per filename
     key_files = []
-    for pattern in ["package.json", "pyproject.toml", "requirements.txt", "Cargo.toml", "go.mod", "pom.xml", "build.gradle", "Makefile", "README.md"]:
-        files = list(project_dir.glob(pattern))
-        key_files.extend(files)
-    
-    # List top-level directories
-    dirs = [d.name for d in project_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
+    dirs = []
+    for entry in project_dir.iterdir():
+        if entry.is_dir():
+            if not entry.name.startswith("."):
+                dirs.append(entry.name)
+        elif entry.name in _KEY_FILENAMES:
+            key_files.append(entry)
     
     context_lines.append(f"Project directory: {project_dir}")
     context_lines.append(f"Key files found: {[f.name for f in key_files]}")
     context_lines.append(f"Top-level directories: {dirs}")
     
-    # Read README if available
+    # Read README if available - only the first 512 bytes, rather than
+    # decoding the whole file for a 500-char preview. Opening directly
+    # skips the separate exists() stat.
     readme = project_dir / "README.md"
-    if readme.exists():
-        readme_preview = readme.read_text(encoding="utf-8")[:500]  # First 500 chars
+    try:
+        with readme.open("rb") as f:
+            readme_preview = f.read(512).decode("utf-8", errors="replace")[:500]
         context_lines.append(f"\nREADME.md preview:\n{readme_preview}")
-    
+    except FileNotFoundError:
+        pass
+
     return "\n".join(context_lines)
 
 
+def analyze_project_context(project_dir: Path) -> str:
+    """Analyze project directory to understand context.
+
+    Results are cached by the directory's mtime, so rebuilding the
+    context across interview turns reuses the previous scan.
+    """
+    return _analyze_cached(str(project_dir), project_dir.stat().st_mtime_ns)
+
+
+def _filter_responsive_providers(provider_rotation) -> None:
+    """Drop providers whose CLIs fail a quick --version probe.
+
+    Probes all providers concurrently, so one broken install doesn't
+    serialize the startup wait for the others. If every probe fails
+    (e.g. a CLI without --version), the rotation is left untouched.
+    """
+    import asyncio
+
+    async def probe(provider) -> bool:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                provider.cli_tool,
+                "--version",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError:
+            return False
+        try:
+            return await asyncio.wait_for(proc.wait(), 2.0) == 0
+        except asyncio.TimeoutError:
+            proc.kill()
+            return False
+
+    async def probe_all(providers) -> list:
+        return await asyncio.gather(*(probe(p) for p in providers))
+
+    results = asyncio.run(probe_all(provider_rotation.providers))
+    responsive = [p for p, ok in zip(provider_rotation.providers, results) if ok]
+
+    if responsive and len(responsive) < len(provider_rotation.providers):
+        dropped = len(provider_rotation.providers) - len(responsive)
+        console.print(f"[{THEME['muted']}]Skipping {dropped} unresponsive provider(s)[/]")
+        provider_rotation.providers = responsive
+        provider_rotation.current_index = 0
+
+
 def build_interview_prompt(project_dir: Path) -> str:
     """Build the interview prompt for cursor-agent."""
     context = analyze_project_context(project_dir)
@@ -175,30 +240,64 @@ Start by analyzing the project context and then ask your first question to the u
     return prompt
 
 
+# Fenced code blocks in LLM messages; one C-level scan replaces the
+# per-line Python loop over the whole response
+_CODE_BLOCK_RE = re.compile(r"```[a-zA-Z]*\n(.*?)```", re.DOTALL)
+
+
+def _append_text(path: Path, text: str) -> None:
+    """Append text to a file in binary append mode.
+
+    O_APPEND keeps per-turn checkpoint cost proportional to the new text
+    instead of rewriting the whole conversation each turn.
+    """
+    with open(path, "ab") as f:
+        f.write(text.encode("utf-8"))
+
+
+def _write_task_file(task_file: Path, content: str) -> None:
+    """Write task-file content through a raw fd: one encode, one write."""
+    data = content.encode("utf-8")
+    fd = os.open(task_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 def extract_task_file_from_message(text: str, project_dir: Path) -> Optional[Path]:
     """Extract task file content from LLM message if it contains it."""
     # Look for markdown code blocks with RALPH_TASK.md content
     # This is a fallback - ideally the LLM will use writeToolCall
-    
+
     # Check if text contains frontmatter pattern
-    if "---" in text and "task:" in text.lower():
-        # Try to extract the content between markdown code blocks
-        lines = text.split("\n")
-        in_code_block = False
-        content_lines = []
-        
-        for line in lines:
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block or (not in_code_block and ("---" in line or line.strip().startswith("#") or "- [ ]" in line)):
-                content_lines.append(line)
-        
-        if content_lines:
-            task_file = project_dir / "RALPH_TASK.md"
-            task_file.write_text("\n".join(content_lines), encoding="utf-8")
+    if "---" not in text or "task:" not in text.lower():
+        return None
+
+    task_file = project_dir / "RALPH_TASK.md"
+
+    # Fast path: a fenced block holding the frontmatter is the whole file
+    for block in _CODE_BLOCK_RE.findall(text):
+        if "---" in block and "task:" in block.lower():
+            _write_task_file(task_file, block)
             return task_file
-    
+
+    # Fallback for unfenced responses: collect frontmatter/checkbox lines
+    lines = text.split("\n")
+    in_code_block = False
+    content_lines = []
+
+    for line in lines:
+        if line.strip().startswith("```"):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block or (not in_code_block and ("---" in line or line.strip().startswith("#") or "- [ ]" in line)):
+            content_lines.append(line)
+
+    if content_lines:
+        _write_task_file(task_file, "\n".join(content_lines))
+        return task_file
+
     return None
 
 
@@ -212,17 +311,23 @@ def create_task_file(project_dir: Path, initial_instruction: Optional[str] = Non
         project_dir: Project directory to create task file in
         initial_instruction: Optional initial instruction from user to start the interview
     """
+    from ralph.providers import get_provider_rotation
+
     task_file = project_dir / "RALPH_TASK.md"
-    
+
     if task_file.exists():
         console.print(f"[{THEME['warning']}]⚠[/] RALPH_TASK.md already exists. Skipping interview.")
         return
-    
+
     # Detect available providers and create rotation manager
     provider_rotation = get_provider_rotation()
     if not provider_rotation.providers:
         console.print(f"[{THEME['error']}]✗[/] No LLM providers available. Please install agent, claude, gemini, or codex.")
         raise Exception("No LLM providers available for interview")
+
+    # Probe providers concurrently so broken installs are skipped up
+    # front instead of each timing out in turn during the interview
+    _filter_responsive_providers(provider_rotation)
     
     console.print()
     console.print(Rule(f"[bold {THEME['primary']}]Task Interview[/]", style=THEME["primary"]))
@@ -240,12 +345,14 @@ def create_task_file(project_dir: Path, initial_instruction: Optional[str] = Non
     ralph_dir.mkdir(exist_ok=True)
     conversation_file = ralph_dir / "interview.md"
     
-    # Initialize conversation file with initial prompt
+    # Initialize conversation with initial prompt, kept in memory; the
+    # file is only a crash-recovery checkpoint written once per turn
     # If user provided an initial instruction, add it as the user's first message
     conversation_content = initial_prompt
     if initial_instruction:
         conversation_content = initial_prompt + "\n\n---\n\nUser: " + initial_instruction + "\n\nYou now have the user's task description. Please proceed to create the RALPH_TASK.md file based on this instruction. Ask any clarifying questions if needed, but remember: create the task file even for large tasks - Ralph works iteratively."
-    
+
+    conversation_parts = [conversation_content]
     conversation_file.write_text(conversation_content, encoding="utf-8")
     
     # Try providers until one succeeds
@@ -266,44 +373,41 @@ def create_task_file(project_dir: Path, initial_instruction: Optional[str] = Non
             console.print()
             
             # Import turn-based helpers
-            from ralph.interview_turns import run_single_turn, wait_for_user_input, append_user_response
-            
-            # Conversation loop using temporary file
+            from ralph.interview_turns import run_single_turn, wait_for_user_input
+
+            # Conversation loop using the in-memory buffer
             turn = 0
             max_turns = 20  # Prevent infinite loops
-            
+
             while turn < max_turns:
                 turn += 1
-                
-                # Run one turn: send conversation to provider, get response
-                task_file_created, last_message = run_single_turn(
-                    provider, conversation_file, project_dir
+
+                # Run one turn: send conversation to provider, get
+                # response; fragments stream straight into the
+                # conversation checkpoint as they arrive
+                task_file_created, last_message, ai_response = run_single_turn(
+                    provider, "\n\n".join(conversation_parts), project_dir,
+                    conversation_file=conversation_file,
                 )
+
+                if ai_response:
+                    conversation_parts.append(ai_response)
                 
-                # Check if task file was created
+                # Check if task file was created - one stat per turn
+                # covers both the direct check and the tool-call path
                 if task_file.exists():
                     console.print(f"[{THEME['success']}]✓[/] Task file ready: {task_file}")
                     # Clean up conversation file
-                    if conversation_file.exists():
-                        conversation_file.unlink()
+                    conversation_file.unlink(missing_ok=True)
                     return
-                
-                # If task file created via tool call, check again
-                if task_file_created:
-                    if task_file.exists():
-                        console.print(f"[{THEME['success']}]✓[/] Task file ready: {task_file}")
-                        if conversation_file.exists():
-                            conversation_file.unlink()
-                        return
-                
+
                 # If we got a completion sigil but no file, check for extraction
                 if last_message and ("---" in last_message and "task:" in last_message.lower()):
                     extracted = extract_task_file_from_message(last_message, project_dir)
-                    if extracted and extracted.exists():
+                    if extracted:
                         console.print(f"[{THEME['success']}]✓[/] Task file extracted from conversation.")
                         console.print()
-                        if conversation_file.exists():
-                            conversation_file.unlink()
+                        conversation_file.unlink(missing_ok=True)
                         return
                 
                 # Process exited, task file not created - wait for user input
@@ -315,9 +419,11 @@ def create_task_file(project_dir: Path, initial_instruction: Optional[str] = Non
                     if not user_response.strip():
                         console.print(f"[{THEME['warning']}]⚠[/] Empty response. Continuing...")
                         continue
-                    
-                    # Append user response to conversation file
-                    append_user_response(conversation_file, user_response)
+
+                    # Append user response to the conversation buffer
+                    # and its on-disk checkpoint
+                    conversation_parts.append(f"User: {user_response}")
+                    _append_text(conversation_file, f"\n\nUser: {user_response}")
                 else:
                     # No response from AI, break and try next provider
                     break
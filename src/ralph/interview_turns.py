@@ -1,33 +1,96 @@
 """Helper functions for turn-based interview using conversation file."""
 
-import readline  # Enables up-arrow history in input
+import os
+import selectors
 import subprocess
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.prompt import Prompt
 
 from ralph.signals import TAG_DONE
-from ralph.ui import THEME
+from ralph.theme import THEME
 
 console = Console()
 
+# Immutable panel parameters, built once instead of per assistant
+# fragment
+_PANEL_KW = dict(
+    title="[bold yellow]Ralph[/]",
+    border_style=THEME["primary"],
+    padding=(1, 2),
+)
+
+# Completion sigils arrive at the end of a message, so only a running
+# tail of the assistant text needs scanning; the buffer spans fragments
+# in case the sigil is split across two of them
+_SIGIL_TAIL_WINDOW = 128
+
+
+def _iter_stream_lines(process, chunk_size: int = 65536):
+    """Yield stripped byte lines from the process's stdout.
+
+    Both stdout and stderr are registered with a selector and drained as
+    they become readable, so a chatty stderr can't fill its pipe buffer
+    and deadlock the child while stdout is being read. Stdout is read in
+    large chunks and split on newlines in one pass, avoiding a
+    Python-level readline round-trip per line of stream-json output.
+    Lines stay as bytes so callers can dispatch on the first byte before
+    paying for a decode.
+    """
+    sel = selectors.DefaultSelector()
+    sel.register(process.stdout, selectors.EVENT_READ, True)   # stdout
+    sel.register(process.stderr, selectors.EVENT_READ, False)  # stderr
+
+    buffer = bytearray()
+    try:
+        while sel.get_map():
+            for key, _ in sel.select():
+                chunk = os.read(key.fd, chunk_size)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    continue
+                if not key.data:
+                    # stderr - drained to keep the pipe moving, discarded
+                    continue
+                buffer.extend(chunk)
+                if b"\n" not in chunk:
+                    continue
+                lines = buffer.split(b"\n")
+                buffer = bytearray(lines.pop())  # keep the partial fragment
+                for line in lines:
+                    yield line.strip()
+    finally:
+        sel.close()
+
+    # EOF on both pipes - flush any trailing partial line
+    if buffer:
+        yield bytes(buffer).strip()
+
 
 def run_single_turn(
     provider,
-    conversation_file: Path,
+    conversation_text: str,
     project_dir: Path,
-) -> tuple[bool, Optional[str]]:
-    """Run a single turn: send conversation file to provider, parse response.
-    
-    Returns: (task_file_created, last_ai_message)
+    conversation_file: Optional[Path] = None,
+) -> tuple[bool, Optional[str], Optional[str]]:
+    """Run a single turn: send conversation text to provider, parse response.
+
+    The caller owns the conversation buffer; this avoids re-reading and
+    rewriting the conversation file on every turn. If conversation_file
+    is given, assistant fragments are streamed into it through a single
+    append handle as they arrive, so the on-disk checkpoint tracks the
+    turn instead of being written at the end.
+
+    Returns: (task_file_created, last_ai_message, ai_response) where
+    ai_response is the full response text to append to the conversation,
+    or None if the provider produced no output.
     """
-    # Read current conversation
-    conversation_text = conversation_file.read_text(encoding="utf-8")
-    
+    # Markdown/Panel pull in rich's heavier renderers - only needed once
+    # a turn actually runs
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     # Build provider command (use conversation as prompt)
     cmd = provider.get_command(conversation_text, project_dir)
     
@@ -49,18 +112,19 @@ def run_single_turn(
     last_ai_message = None
     task_file_created = False
     ai_response_parts = []
-    
-    while True:
-        line = agent_process.stdout.readline()
-        if not line:
-            if agent_process.poll() is not None:
-                break
-            continue
-        
-        line_text = line.decode("utf-8", errors="ignore").strip()
-        if not line_text:
+    sigil_tail = ""
+
+    # One append handle for the whole turn
+    conv_fh = open(conversation_file, "ab") if conversation_file else None
+
+    for raw_line in _iter_stream_lines(agent_process):
+        # Only JSON lines matter here - dispatch on the first byte and
+        # skip the str allocation for everything else
+        if not raw_line or raw_line[:1] not in (b"{", b"["):
             continue
-        
+
+        line_text = raw_line.decode("utf-8", errors="ignore")
+
         # Parse line using provider adapter
         data = provider.parse_stream_line(line_text)
         if data is None:
@@ -69,34 +133,46 @@ def run_single_turn(
         msg_type = data.get("type", "")
         subtype = data.get("subtype", "")
         
-        # Collect assistant messages
+        # Collect assistant messages - single-step get() lookups without
+        # the throwaway default dict/list allocations per line
         if msg_type == "assistant":
-            content = data.get("message", {}).get("content", [])
-            if content and isinstance(content, list):
+            msg = data.get("message")
+            content = msg.get("content") if msg is not None else None
+            if content and type(content) is list:
                 for item in content:
-                    if isinstance(item, dict) and "text" in item:
-                        text = item["text"]
-                        ai_response_parts.append(text)
-                        
-                        # Display to user with styled panel and markdown rendering
-                        if text.strip():
-                            console.print()
-                            console.print(Panel(
-                                Markdown(text),
-                                title="[bold yellow]Ralph[/]",
-                                border_style=THEME["primary"],
-                                padding=(1, 2),
-                            ))
-                        
-                        last_ai_message = text
-                        
-                        # Check for completion sigil
-                        if TAG_DONE in text:
-                            task_file_created = True
-                            console.print("[green]✓[/green] Interview complete! Task file generated.\n")
+                    text = item.get("text") if type(item) is dict else None
+                    if text is None:
+                        continue
+
+                    ai_response_parts.append(text)
+
+                    # Stream the fragment to the checkpoint file
+                    if conv_fh is not None:
+                        conv_fh.write(b"\n\n")
+                        conv_fh.write(text.encode("utf-8"))
+
+                    # Display to user with styled panel and markdown rendering
+                    if text.strip():
+                        console.print()
+                        console.print(Panel(Markdown(text), **_PANEL_KW))
+                    
+                    last_ai_message = text
+                    
+                    # Check for completion sigil - only the running
+                    # tail, not every byte of every fragment
+                    sigil_tail = (sigil_tail + text)[-_SIGIL_TAIL_WINDOW:]
+                    if TAG_DONE in sigil_tail:
+                        task_file_created = True
+                        console.print("[green]✓[/green] Interview complete! Task file generated.\n")
         
-        # Detect task file write via tool call
-        elif msg_type == "tool_call" and subtype == "completed":
+        # Detect task file write via tool call - cheap bytes substring
+        # pre-check before descending the nested tool-call dicts, since
+        # most tool calls never touch the task file
+        elif (
+            msg_type == "tool_call"
+            and subtype == "completed"
+            and b"RALPH_TASK" in raw_line
+        ):
             tool_call = data.get("tool_call", {})
             write_tool = tool_call.get("writeToolCall")
             
@@ -106,25 +182,24 @@ def run_single_turn(
                 if success:
                     path = write_tool.get("args", {}).get("path", "")
                     if "RALPH_TASK.md" in path:
-                        if path.startswith("/"):
-                            written_file = Path(path)
-                        else:
-                            written_file = project_dir / path
-                        
-                        if written_file.exists() and written_file.name == "RALPH_TASK.md":
+                        # Trust the reported success: string ops and a
+                        # basename check instead of Path construction
+                        # plus a redundant stat. Slicing beats a
+                        # startswith method dispatch for one char.
+                        abs_path = path if path[:1] == "/" else f"{project_dir}/{path}"
+                        if os.path.basename(abs_path) == "RALPH_TASK.md":
                             task_file_created = True
-                            console.print(f"[green]✓[/green] RALPH_TASK.md created at {written_file}\n")
+                            console.print(f"[green]✓[/green] RALPH_TASK.md created at {abs_path}\n")
     
+    if conv_fh is not None:
+        conv_fh.close()
+
     # Wait for process
     agent_process.wait()
-    
-    # Append AI response to conversation file if we got one
-    if ai_response_parts:
-        ai_response = "\n\n".join(ai_response_parts)
-        current_conversation = conversation_file.read_text(encoding="utf-8")
-        conversation_file.write_text(current_conversation + "\n\n" + ai_response, encoding="utf-8")
-    
-    return task_file_created, last_ai_message
+
+    ai_response = "\n\n".join(ai_response_parts) if ai_response_parts else None
+
+    return task_file_created, last_ai_message, ai_response
 
 
 def wait_for_user_input() -> str:
@@ -133,6 +208,9 @@ def wait_for_user_input() -> str:
     Uses rich.prompt.Prompt for styled input with readline history support
     (up-arrow to recall previous responses within the session).
     """
+    import readline  # noqa: F401 - enables up-arrow history in input
+    from rich.prompt import Prompt
+
     try:
         console.print()  # Add spacing
         user_input = Prompt.ask(
@@ -153,19 +231,25 @@ def wait_for_user_input_with_timeout(timeout: int = 60) -> Optional[str]:
     Returns:
         User's input string, or None if timeout reached or cancelled.
     """
-    import select
+    import selectors
     import sys
-    
+
     console.print()  # Add spacing
     console.print(f"[{THEME['muted']}]You have {timeout} seconds to respond (press Enter to skip)...[/]")
     console.print(f"[bold {THEME['accent']}]Your answer:[/] ", end="")
-    
+
     try:
-        # Use select to implement timeout on stdin
-        # This works on Unix-like systems
-        rlist, _, _ = select.select([sys.stdin], [], [], timeout)
-        
-        if rlist:
+        # DefaultSelector picks epoll/kqueue/poll per platform (with a
+        # select fallback on Windows), instead of rebuilding select()'s
+        # fd_set lists on every call
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(sys.stdin, selectors.EVENT_READ)
+            events = sel.select(timeout)
+        finally:
+            sel.close()
+
+        if events:
             # Input available
             user_input = sys.stdin.readline().strip()
             return user_input if user_input else None
@@ -174,13 +258,13 @@ def wait_for_user_input_with_timeout(timeout: int = 60) -> Optional[str]:
             console.print()  # New line after timeout
             console.print(f"[{THEME['warning']}]Timeout reached - continuing without answer[/]")
             return None
-            
+
     except (EOFError, KeyboardInterrupt):
         console.print()  # New line after interrupt
         return None
     except Exception:
-        # select may not work on Windows - fall back to blocking input
-        # with a warning
+        # stdin may not be selectable (e.g. not a real file) - fall back
+        # to blocking input with a warning
         console.print(f"[{THEME['warning']}]Note: timeout not supported on this platform[/]")
         try:
             user_input = input().strip()
@@ -189,7 +273,3 @@ def wait_for_user_input_with_timeout(timeout: int = 60) -> Optional[str]:
             return None
 
 
-def append_user_response(conversation_file: Path, user_response: str) -> None:
-    """Append user's response to the conversation file."""
-    current = conversation_file.read_text(encoding="utf-8")
-    conversation_file.write_text(current + "\n\n" + f"User: {user_response}", encoding="utf-8")
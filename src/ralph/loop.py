@@ -4,18 +4,20 @@ import subprocess
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Optional, Set, TYPE_CHECKING
+from typing import Callable, Optional, Set
+
+from rich.console import Console
 
 from ralph import git_utils, gutter, parser, state, task, tokens
-from ralph.archive import archive_completed_task
-from ralph.debug import debug_log
+from ralph.archive import archive_completed_task, wait_for_pending_commits
+from ralph.debug import debug_log, is_debug_enabled
 from ralph.prompts import build_prompt, build_verification_prompt
-from ralph.providers import ProviderRotation
+from ralph.providers import ProviderRotation, get_provider_rotation
 from ralph.signals import Signal, CRITICAL_SIGNALS, VERIFICATION_SIGNALS
 from ralph.ui import RalphLiveDisplay, get_criteria_list, display_question_panel
 
-if TYPE_CHECKING:
-    from rich.console import Console
+# Shared console for loop output, built once per process
+_console = Console()
 
 
 def _run_iteration_core(
@@ -61,37 +63,20 @@ def _run_iteration_core(
     gutter_detector = gutter.GutterDetector()
     
     # Log session start - use display name for user-facing output
+    # BaseProvider guarantees cli_tool/get_display_name - no hasattr probe
     provider_display = provider.get_display_name()
-    provider_cli = provider.cli_tool if hasattr(provider, 'cli_tool') else str(type(provider).__name__)
+    provider_cli = provider.cli_tool
     state.log_progress(workspace, f"**{log_message}** (provider: {provider_display})")
     
     # Build provider command with workspace directory
     cmd = provider.get_command(prompt, workspace)
-    
-    # #region agent log
-    import json
-    import os
-    try:
-        log_dir = "/Users/alex/repos/pyralph/.cursor"
-        os.makedirs(log_dir, exist_ok=True)
-        log_path = f"{log_dir}/debug.log"
-        provider_cli = provider.get_cli_tool_name() if hasattr(provider, 'get_cli_tool_name') else str(type(provider).__name__)
-        entry_log = {
-            "id": f"log_{int(time.time())}_entry",
-            "timestamp": int(time.time() * 1000),
-            "location": "loop.py:_run_iteration_core:69",
-            "message": "About to start subprocess",
-            "data": {"log_message": log_message, "provider": provider_cli, "cmd": cmd},
-            "sessionId": "debug-session",
-            "runId": "run1",
-            "hypothesisId": "A"
-        }
-        with open(log_path, "a") as f:
-            f.write(json.dumps(entry_log) + "\n")
-    except Exception:
-        pass
-    # #endregion
-    
+
+    debug_log(
+        "loop.py:_run_iteration_core",
+        "About to start subprocess",
+        {"log_message": log_message, "provider": provider_cli, "cmd": cmd},
+    )
+
     # Start agent process
     agent_process = None
     try:
@@ -104,29 +89,11 @@ def _run_iteration_core(
             text=False,
         )
     except Exception as e:
-        # #region agent log
-        import json
-        import os
-        try:
-            log_dir = "/Users/alex/repos/pyralph/.cursor"
-            os.makedirs(log_dir, exist_ok=True)
-            log_path = f"{log_dir}/debug.log"
-            provider_cli = provider.get_cli_tool_name() if hasattr(provider, 'get_cli_tool_name') else str(type(provider).__name__)
-            error_log = {
-                "id": f"log_{int(time.time())}_popen_error",
-                "timestamp": int(time.time() * 1000),
-                "location": "loop.py:_run_iteration_core:72",
-                "message": "Subprocess.Popen failed",
-                "data": {"error": str(e), "error_type": type(e).__name__, "cmd": cmd, "provider": provider_cli},
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "A"
-            }
-            with open(log_path, "a") as f:
-                f.write(json.dumps(error_log) + "\n")
-        except Exception:
-            pass
-        # #endregion
+        debug_log(
+            "loop.py:_run_iteration_core",
+            "Subprocess.Popen failed",
+            {"error": str(e), "error_type": type(e).__name__, "cmd": cmd, "provider": provider_cli},
+        )
         if reraise_exceptions:
             raise
         return timeout_signal
@@ -176,39 +143,17 @@ def _run_iteration_core(
                 signal = timeout_signal
                 break
     except Exception as e:
-        # #region agent log
-        import json
-        import os
         import traceback
-        try:
-            log_dir = "/Users/alex/repos/pyralph/.cursor"
-            os.makedirs(log_dir, exist_ok=True)
-            log_path = f"{log_dir}/debug.log"
-            provider_cli = provider.get_cli_tool_name() if hasattr(provider, 'get_cli_tool_name') else str(type(provider).__name__)
-            error_log = {
-                "id": f"log_{int(time.time())}_parse_exception",
-                "timestamp": int(time.time() * 1000),
-                "location": "loop.py:_run_iteration_core:180",
-                "message": "Exception during stream parsing",
-                "data": {
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "traceback": traceback.format_exc(),
-                    "provider": provider_cli,
-                },
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "A"
-            }
-            with open(log_path, "a") as f:
-                f.write(json.dumps(error_log) + "\n")
-        except Exception:
-            pass
-        # #endregion
+
         debug_log(
             "loop.py:_run_iteration_core",
             "Exception during stream parsing",
-            {"error": str(e), "provider": provider_cli},
+            {
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "traceback": traceback.format_exc(),
+                "provider": provider_cli,
+            },
         )
         agent_process.terminate()
         if reraise_exceptions:
@@ -230,97 +175,50 @@ def _run_iteration_core(
         agent_process.kill()
         agent_process.wait()
     
-    # #region agent log
-    import json
-    import os
+    returncode = agent_process.returncode
+
+    # Collect stderr - the stream parser drains it while running and
+    # stashes it on the process; pick up anything still left in the pipe
+    stderr_bytes = getattr(agent_process, "ralph_stderr", b"")
     try:
-        log_dir = "/Users/alex/repos/pyralph/.cursor"
-        os.makedirs(log_dir, exist_ok=True)
-        log_path = f"{log_dir}/debug.log"
-        returncode = agent_process.returncode
-        
-        # Read stderr - this may have been partially consumed, try to read what's left
-        stderr_bytes = b""
-        try:
-            if agent_process.stderr:
-                remaining_stderr = agent_process.stderr.read()
-                if remaining_stderr:
-                    stderr_bytes = remaining_stderr
-        except Exception:
-            pass  # stderr may already be closed
-        
-        stderr_text = stderr_bytes.decode("utf-8", errors="replace") if stderr_bytes else ""
-        
-        # Also try to read any remaining stdout that wasn't consumed by parse_stream
-        stdout_bytes = b""
-        try:
-            if agent_process.stdout:
-                # Try to peek/read any remaining data (though parse_stream should have consumed it)
-                pass  # stdout is typically consumed by parse_stream, but log if there's anything
-        except Exception:
-            pass
-        
-        log_entry = {
-            "id": f"log_{int(time.time())}_{id(agent_process)}",
-            "timestamp": int(time.time() * 1000),
-            "location": "loop.py:_run_iteration_core:229",
-            "message": "Process completed - checking returncode and stderr",
-            "data": {
-                "returncode": returncode,
-                "signal": signal,
-                "stderr_length": len(stderr_text),
-                "stderr_full": stderr_text,  # Log full stderr, not just preview
-                "provider": provider_cli,
-            },
-            "sessionId": "debug-session",
-            "runId": "run1",
-            "hypothesisId": "A"
-        }
-        with open(log_path, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        if agent_process.stderr:
+            remaining_stderr = agent_process.stderr.read()
+            if remaining_stderr:
+                stderr_bytes += remaining_stderr
+    except Exception:
+        pass  # stderr may already be closed
+
+    stderr_text = stderr_bytes.decode("utf-8", errors="replace") if stderr_bytes else ""
+
+    debug_log(
+        "loop.py:_run_iteration_core",
+        "Process completed - checking returncode and stderr",
+        {
+            "returncode": returncode,
+            "signal": signal,
+            "stderr_length": len(stderr_text),
+            "stderr_full": stderr_text,  # Log full stderr, not just preview
+            "provider": provider_cli,
+        },
+    )
+
+    # Persist exact stderr to a user-facing file (even if empty)
+    try:
+        ralph_dir = workspace / ".ralph"
+        ralph_dir.mkdir(exist_ok=True)
+        cli_output_file = ralph_dir / "cli_output.log"
+        with cli_output_file.open("a", encoding="utf-8") as f_out:
+            f_out.write("\n" + "=" * 80 + "\n")
+            f_out.write(
+                f"[{time.strftime('%H:%M:%S')}] provider={provider_cli} stream=stderr returncode={returncode} signal={signal}\n"
+            )
+            f_out.write("=" * 80 + "\n")
+            f_out.write(stderr_text)
+            f_out.write("\n")
+    except Exception:
+        pass
 
-        # Also persist exact stderr to a user-facing file (even if empty)
-        try:
-            ralph_dir = workspace / ".ralph"
-            ralph_dir.mkdir(exist_ok=True)
-            cli_output_file = ralph_dir / "cli_output.log"
-            with cli_output_file.open("a", encoding="utf-8") as f_out:
-                f_out.write("\n" + "=" * 80 + "\n")
-                f_out.write(
-                    f"[{time.strftime('%H:%M:%S')}] provider={provider_cli} stream=stderr returncode={returncode} signal={signal}\n"
-                )
-                f_out.write("=" * 80 + "\n")
-                f_out.write(stderr_text)
-                f_out.write("\n")
-        except Exception:
-            pass
-    except Exception as e:
-        # #region agent log
-        import json
-        import os
-        try:
-            log_dir = "/Users/alex/repos/pyralph/.cursor"
-            os.makedirs(log_dir, exist_ok=True)
-            log_path = f"{log_dir}/debug.log"
-            error_log = {
-                "id": f"log_{int(time.time())}_error",
-                "timestamp": int(time.time() * 1000),
-                "location": "loop.py:_run_iteration_core:151",
-                "message": "Exception in instrumentation",
-                "data": {"error": str(e), "error_type": type(e).__name__},
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "A"
-            }
-            with open(log_path, "a") as f:
-                f.write(json.dumps(error_log) + "\n")
-        except Exception:
-            pass
-        # #endregion
-    # #endregion
-    
     # Check process returncode - if non-zero and no signal received, treat as failure
-    returncode = agent_process.returncode
     if returncode is not None and returncode != 0 and not signal:
         # Process exited with error but no signal was emitted - treat as failure
         # For verification iterations, use VERIFY_FAIL; for regular, use timeout_signal
@@ -426,6 +324,7 @@ def run_ralph_loop(
     rotate_threshold: int = tokens.ROTATE_THRESHOLD,
     timeout: int = 300,
     max_verification_failures: int = 3,
+    pause_between_iterations: float = 0.0,
 ) -> None:
     """Run the main Ralph loop with provider rotation.
     
@@ -438,9 +337,9 @@ def run_ralph_loop(
         rotate_threshold: Token count at which to trigger rotation
         timeout: Timeout in seconds for provider operations (default 300)
         max_verification_failures: Maximum consecutive verification failures before giving up (default 3)
+        pause_between_iterations: Optional rate-limiting pause in seconds between
+            iterations (default 0.0 - no dead time)
     """
-    from ralph.providers import get_provider_rotation
-    
     workspace = project_dir.resolve()
     task_file = workspace / "RALPH_TASK.md"
     
@@ -461,8 +360,7 @@ def run_ralph_loop(
     iteration = 1
     verification_failures = 0
     
-    from rich.console import Console
-    console = Console()
+    console = _console
     
     # Create live display
     try:
@@ -488,6 +386,8 @@ def run_ralph_loop(
     
     with live_display:
         while iteration <= max_iterations:
+            iteration_started = time.monotonic()
+
             # Clean up any leftover question/answer files from previous iteration
             question_file = workspace / ".ralph" / "question.md"
             answer_file = workspace / ".ralph" / "answer.md"
@@ -506,18 +406,21 @@ def run_ralph_loop(
                 criteria=criteria,
             )
             
-            debug_log(
-                "loop.py:run_ralph_loop",
-                "Loop iteration started",
-                {
-                    "iteration": iteration,
-                    "provider_name": provider_name,
-                    "current_index": provider_rotation.current_index,
-                    "total_providers": len(provider_rotation.providers),
-                    "provider_names": [p.cli_tool if hasattr(p, 'cli_tool') else str(type(p).__name__) for p in provider_rotation.providers]
-                },
-                "A"
-            )
+            # Guarded so the payload (including the provider-name list)
+            # isn't built every iteration when debug output is off
+            if is_debug_enabled():
+                debug_log(
+                    "loop.py:run_ralph_loop",
+                    "Loop iteration started",
+                    {
+                        "iteration": iteration,
+                        "provider_name": provider_name,
+                        "current_index": provider_rotation.current_index,
+                        "total_providers": len(provider_rotation.providers),
+                        "provider_names": [p.cli_tool for p in provider_rotation.providers]
+                    },
+                    "A"
+                )
             
             try:
                 # Run iteration with token update callback
@@ -572,6 +475,10 @@ def run_ralph_loop(
                             console.print(f"[dim]Task archived to: {archive_path.relative_to(workspace)}[/]")
                             state.log_progress(workspace, f"**Task archived** to {archive_path.name}")
                         
+                        # Let the background archive commit land before
+                        # pushing or exiting
+                        wait_for_pending_commits()
+
                         if open_pr and branch:
                             git_utils.push_branch(workspace, branch)
                             git_utils.open_pr(workspace, branch)
@@ -619,6 +526,10 @@ def run_ralph_loop(
                             console.print(f"[dim]Task archived to: {archive_path.relative_to(workspace)}[/]")
                             state.log_progress(workspace, f"**Task archived** to {archive_path.name}")
                         
+                        # Let the background archive commit land before
+                        # pushing or exiting
+                        wait_for_pending_commits()
+
                         if open_pr and branch:
                             git_utils.push_branch(workspace, branch)
                             git_utils.open_pr(workspace, branch)
@@ -684,28 +595,32 @@ def run_ralph_loop(
                         "B"
                     )
                     
-                    state.log_progress(workspace, f"**Session {iteration} ended** - ⚠ GUTTER (agent stuck) - {provider_name}")
-                    
-                    # Rotate to next provider
-                    next_provider = provider_rotation.rotate()
-                    
-                    next_name = provider_rotation.get_provider_name() if next_provider else None
-                    debug_log(
-                        "loop.py:run_ralph_loop",
-                        "After GUTTER rotation",
-                        {
-                            "iteration": iteration,
-                            "old_provider": provider_name,
-                            "new_provider": next_name,
-                            "current_index_after": provider_rotation.current_index,
-                            "next_provider_returned": next_provider is not None,
-                            "has_next": provider_rotation.has_next()
-                        },
-                        "B"
-                    )
-                    
+                    # Both gutter entries flush through one append
+                    with state.progress_batch(workspace) as progress:
+                        progress.log(f"**Session {iteration} ended** - ⚠ GUTTER (agent stuck) - {provider_name}")
+
+                        # Rotate to next provider
+                        next_provider = provider_rotation.rotate()
+
+                        next_name = provider_rotation.get_provider_name() if next_provider else None
+                        debug_log(
+                            "loop.py:run_ralph_loop",
+                            "After GUTTER rotation",
+                            {
+                                "iteration": iteration,
+                                "old_provider": provider_name,
+                                "new_provider": next_name,
+                                "current_index_after": provider_rotation.current_index,
+                                "next_provider_returned": next_provider is not None,
+                                "has_next": provider_rotation.has_next()
+                            },
+                            "B"
+                        )
+
+                        if next_provider and provider_rotation.has_next():
+                            progress.log(f"**Provider rotation** - {provider_name} → {next_name} (gutter)")
+
                     if next_provider and provider_rotation.has_next():
-                        state.log_progress(workspace, f"**Provider rotation** - {provider_name} → {next_name} (gutter)")
                         # Retry same iteration with new provider
                         continue
                     else:
@@ -819,8 +734,12 @@ def run_ralph_loop(
                     iteration += 1
                     continue
             
-            # Brief pause between iterations
-            time.sleep(2)
+            # Optional pause between iterations - long iterations absorb
+            # it, and signals that already imply latency skip it
+            if pause_between_iterations > 0 and signal not in (Signal.ROTATE, Signal.GUTTER, Signal.COMPLETE):
+                remaining = pause_between_iterations - (time.monotonic() - iteration_started)
+                if remaining > 0:
+                    time.sleep(remaining)
     
     # Max iterations reached
     state.log_progress(workspace, f"**Loop ended** - ⚠ Max iterations ({max_iterations}) reached")
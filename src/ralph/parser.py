@@ -1,8 +1,11 @@
 """Stream parser for LLM provider output."""
 
+import os
 import re
+import selectors
 import subprocess
 import time
+from collections import deque
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
@@ -10,6 +13,7 @@ import yaml
 from rich.console import Console
 
 from ralph import gutter, state, tokens
+from ralph.debug import debug_log, is_debug_enabled
 from ralph.providers.base import BaseProvider
 from ralph.signals import Signal, TAG_COMPLETE, TAG_GUTTER, TAG_QUESTION, TAG_VERIFY_PASS, TAG_VERIFY_FAIL
 
@@ -49,6 +53,47 @@ def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
 _default_console = Console()
 
 
+def _iter_agent_lines(agent_process: subprocess.Popen, chunk_size: int = 65536) -> Iterator[str]:
+    """Yield decoded, stripped lines from the agent's stdout.
+
+    Both pipes are registered with a selector: stdout is read in large
+    chunks and split on newlines (instead of a readline call per line),
+    while stderr is drained as it arrives so the child can't stall on a
+    full stderr pipe. Drained stderr is stashed on the process object as
+    ``ralph_stderr`` for post-exit logging.
+    """
+    sel = selectors.DefaultSelector()
+    sel.register(agent_process.stdout, selectors.EVENT_READ, True)   # stdout
+    sel.register(agent_process.stderr, selectors.EVENT_READ, False)  # stderr
+
+    stdout_buf = bytearray()
+    stderr_chunks = []
+    try:
+        while sel.get_map():
+            for key, _ in sel.select():
+                chunk = os.read(key.fd, chunk_size)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    continue
+                if not key.data:
+                    stderr_chunks.append(chunk)
+                    continue
+                stdout_buf.extend(chunk)
+                if b"\n" not in chunk:
+                    continue
+                lines = stdout_buf.split(b"\n")
+                stdout_buf = bytearray(lines.pop())  # keep the partial fragment
+                for raw in lines:
+                    yield raw.decode("utf-8", errors="ignore").strip()
+    finally:
+        sel.close()
+        agent_process.ralph_stderr = b"".join(stderr_chunks)
+
+    # EOF on both pipes - flush any trailing partial line
+    if stdout_buf:
+        yield bytes(stdout_buf).decode("utf-8", errors="ignore").strip()
+
+
 def parse_stream(
     workspace: Path,
     agent_process: subprocess.Popen,
@@ -83,19 +128,15 @@ def parse_stream(
 
     last_token_log = int(time.time())
 
-    # Collect all stdout lines for logging
-    stdout_lines = []
+    # Bounded ring buffer of recent stdout lines for logging - constant
+    # memory no matter how much the provider streams
+    stdout_lines = deque(maxlen=1000)
 
-    # Read line by line from agent stdout
-    while True:
-        line = agent_process.stdout.readline()
-        if not line:
-            # Process ended
-            break
+    # Read agent stdout in chunks while keeping stderr drained
+    for line_text in _iter_agent_lines(agent_process):
+        # Store a capped copy for logging
+        stdout_lines.append(line_text if len(line_text) <= 200 else line_text[:200])
 
-        line_text = line.decode("utf-8", errors="ignore").strip()
-        stdout_lines.append(line_text)  # Store for logging
-        
         if not line_text:
             continue
 
@@ -103,30 +144,19 @@ def parse_stream(
 
         # Parse line using provider adapter
         data = provider.parse_stream_line(line)
-        # #region agent log
         if data is None:
-            import json
-            try:
-                log_entry = {
-                    "id": f"log_{int(time.time())}_{hash(line)}",
-                    "timestamp": int(time.time() * 1000),
-                    "location": "parser.py:parse_stream:99",
-                    "message": "parse_stream_line returned None - dropped line",
-                    "data": {
+            if is_debug_enabled():
+                debug_log(
+                    "parser.py:parse_stream",
+                    "parse_stream_line returned None - dropped line",
+                    {
                         "line_preview": line[:200],
                         "line_length": len(line),
-                        "provider": provider.get_cli_tool_name() if hasattr(provider, "get_cli_tool_name") else "unknown",
+                        "provider": provider.cli_tool,
                     },
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "B"
-                }
-                with open("/Users/alex/repos/pyralph/.cursor/debug.log", "a") as f:
-                    f.write(json.dumps(log_entry) + "\n")
-            except Exception:
-                pass
+                    "B",
+                )
             continue
-        # #endregion
 
         signal = process_line(
             workspace, data, token_tracker, gutter_detector, provider,
@@ -166,46 +196,31 @@ def parse_stream(
     tokens_used = token_tracker.calculate_tokens()
     state.log_activity(workspace, f"SESSION END: ~{tokens_used} tokens used")
     
-    # #region agent log
     # Log all stdout output from the process for debugging
-    import json
-    import os
     try:
-        log_dir = "/Users/alex/repos/pyralph/.cursor"
-        os.makedirs(log_dir, exist_ok=True)
-        log_path = f"{log_dir}/debug.log"
         stdout_full = "\n".join(stdout_lines)
-        log_entry = {
-            "id": f"log_{int(time.time())}_stdout",
-            "timestamp": int(time.time() * 1000),
-            "location": "parser.py:parse_stream:162",
-            "message": "Process stdout captured",
-            "data": {
+        debug_log(
+            "parser.py:parse_stream",
+            "Process stdout captured",
+            {
                 "stdout_lines": len(stdout_lines),
                 "stdout_full": stdout_full,
-                "provider": provider.get_cli_tool_name() if hasattr(provider, "get_cli_tool_name") else "unknown",
+                "provider": provider.cli_tool,
             },
-            "sessionId": "debug-session",
-            "runId": "run1",
-            "hypothesisId": "A"
-        }
-        with open(log_path, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        )
 
         # Also persist exact stdout to a user-facing file
-        provider_name = provider.get_cli_tool_name() if hasattr(provider, "get_cli_tool_name") else "unknown"
         ralph_dir = workspace / ".ralph"
         ralph_dir.mkdir(exist_ok=True)
         cli_output_file = ralph_dir / "cli_output.log"
         with cli_output_file.open("a", encoding="utf-8") as f_out:
             f_out.write("\n" + "=" * 80 + "\n")
-            f_out.write(f"[{time.strftime('%H:%M:%S')}] provider={provider_name} stream=stdout\n")
+            f_out.write(f"[{time.strftime('%H:%M:%S')}] provider={provider.cli_tool} stream=stdout\n")
             f_out.write("=" * 80 + "\n")
             f_out.write(stdout_full)
             f_out.write("\n")
     except Exception:
         pass
-    # #endregion
 
 
 def process_line(
@@ -232,30 +247,18 @@ def process_line(
     msg_type = data.get("type", "")
     subtype = data.get("subtype", "")
 
-    # #region agent log
     # Check for error types in data
     if msg_type == "error" or subtype == "error" or data.get("error"):
-        import json
-        try:
-            log_entry = {
-                "id": f"log_{int(time.time())}_{hash(str(data))}",
-                "timestamp": int(time.time() * 1000),
-                "location": "parser.py:process_line:162",
-                "message": "Error type detected in parsed data",
-                "data": {
-                    "msg_type": msg_type,
-                    "subtype": subtype,
-                    "data_preview": str(data)[:300],
-                },
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "C"
-            }
-            with open("/Users/alex/repos/pyralph/.cursor/debug.log", "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
-        except Exception:
-            pass
-    # #endregion
+        debug_log(
+            "parser.py:process_line",
+            "Error type detected in parsed data",
+            {
+                "msg_type": msg_type,
+                "subtype": subtype,
+                "data_preview": str(data)[:300],
+            },
+            "C",
+        )
 
     if msg_type == "system" and subtype == "init":
         provider_name = provider.get_display_name()
@@ -1,5 +1,6 @@
 """Prompt building for Ralph iterations and verification."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -7,6 +8,25 @@ from ralph import state
 from ralph.parser import parse_frontmatter
 
 
+@lru_cache(maxsize=16)
+def _read_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a file, cached by its stat signature."""
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+def _read_state_file(path: Path) -> str:
+    """Read a state file, reusing cached text while its stat is unchanged.
+
+    Iterations re-read the same files every loop; one stat per file
+    replaces a full read+decode when nothing changed.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return ""
+    return _read_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 def build_verification_prompt(workspace: Path, iteration: int) -> str:
     """Build a verification prompt for an independent agent to verify task completion.
     
@@ -20,7 +40,7 @@ def build_verification_prompt(workspace: Path, iteration: int) -> str:
     task_file = workspace / "RALPH_TASK.md"
     
     # Read task file to get requirements and test_command
-    task_content = task_file.read_text(encoding="utf-8") if task_file.exists() else ""
+    task_content = _read_state_file(task_file)
     
     # Parse frontmatter to get test_command
     frontmatter, _ = parse_frontmatter(task_content)
@@ -80,31 +100,9 @@ Begin verification by reading RALPH_TASK.md and running the test command.
     return prompt
 
 
-def build_prompt(workspace: Path, iteration: int) -> str:
-    """Build the Ralph prompt for an iteration.
-    
-    Args:
-        workspace: Project directory path
-        iteration: Current iteration number
-    
-    Returns:
-        Ralph iteration prompt string
-    """
-    task_file = workspace / "RALPH_TASK.md"
-    guardrails_file = workspace / ".ralph" / "guardrails.md"
-    progress_file = workspace / ".ralph" / "progress.md"
-    errors_file = workspace / ".ralph" / "errors.log"
-
-    # Compress progress.md if it's too large (before reading)
-    state.compress_progress_file(workspace)
-
-    # Read state files with explicit UTF-8 encoding
-    task_content = task_file.read_text(encoding="utf-8") if task_file.exists() else ""
-    guardrails_content = guardrails_file.read_text(encoding="utf-8") if guardrails_file.exists() else ""
-    progress_content = progress_file.read_text(encoding="utf-8") if progress_file.exists() else ""
-    errors_content = errors_file.read_text(encoding="utf-8") if errors_file.exists() else ""
-
-    prompt = f"""# Ralph Iteration {iteration}
+# Constant prompt body for iterations, materialized once at import;
+# {iteration} is the only varying field
+_PROMPT_BODY = """# Ralph Iteration {iteration}
 
 You are an autonomous development agent using the Ralph methodology.
 
@@ -201,4 +199,23 @@ You may receive a warning that context is running low. When you see it:
 
 Begin by reading the state files.
 """
-    return prompt
+
+
+def build_prompt(workspace: Path, iteration: int) -> str:
+    """Build the Ralph prompt for an iteration.
+
+    The body is a module-level template - only the iteration number is
+    interpolated. The agent reads the state files itself, so their
+    contents are not embedded here.
+
+    Args:
+        workspace: Project directory path
+        iteration: Current iteration number
+
+    Returns:
+        Ralph iteration prompt string
+    """
+    # Compress progress.md if it's too large (before the agent reads it)
+    state.compress_progress_file(workspace)
+
+    return _PROMPT_BODY.format(iteration=iteration)
@@ -1,8 +1,10 @@
 """Provider registry and factory."""
 
+import os
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from ralph.providers.base import BaseProvider
 from ralph.providers.codex import CodexProvider
@@ -27,16 +29,55 @@ def get_provider(name: str) -> BaseProvider:
     return provider_class()
 
 
+# Detection probes PATH once per provider, so cache recent results and
+# reuse them within one process (run/status both detect, and the loop may
+# re-detect on rotation)
+_DETECT_TTL_SECONDS = 5.0
+_detect_cache: Tuple[float, list[BaseProvider]] = (0.0, [])
+
+
+def _which_set(names: tuple) -> set:
+    """Find which of names exist as executables with one walk of PATH.
+
+    shutil.which walks every PATH directory per name; a single pass
+    shared across all provider names checks each directory once.
+    """
+    found: set[str] = set()
+    path_env = os.environ.get("PATH", os.defpath)
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        for name in names:
+            if name not in found:
+                candidate = os.path.join(directory, name)
+                if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                    found.add(name)
+        if len(found) == len(names):
+            break
+    return found
+
+
 def detect_available_providers() -> list[BaseProvider]:
     """Detect which providers are available on system.
-    
-    Returns list of provider instances in rotation order.
+
+    Returns list of provider instances in rotation order. Results are
+    cached for a few seconds to avoid repeated PATH probes, and all
+    provider names are resolved in a single pass over PATH.
     """
-    available = []
-    for name, provider_class in PROVIDERS.items():
-        provider = provider_class()
-        if provider.is_available():
-            available.append(provider)
+    global _detect_cache
+    now = time.monotonic()
+    cached_at, cached = _detect_cache
+    if cached and now - cached_at < _DETECT_TTL_SECONDS:
+        return cached
+
+    available_names = _which_set(tuple(PROVIDERS))
+    available = [
+        provider_class()
+        for name, provider_class in PROVIDERS.items()
+        if name in available_names
+    ]
+
+    _detect_cache = (now, available)
     return available
 
 
@@ -1,18 +1,39 @@
 """Base provider interface."""
 
+import json
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
 
 import shutil
 
+try:
+    # Optional speedup: orjson parses the per-line stream-json payloads
+    # 2-3x faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared loads for provider stream parsers; both raise ValueError
+# subclasses on malformed input
+json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class BaseProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # User-facing display name; None means the CLI tool name is used.
+    # A class attribute so callers can read it without instantiating.
+    # For example, the 'agent' CLI tool displays as 'cursor' to users.
+    display_name: Optional[str] = None
+
     def __init__(self):
         """Initialize provider with CLI tool name."""
         self.cli_tool = self.get_cli_tool_name()
+        # Resolve the display name once per instance; the loop reads it
+        # several times per iteration
+        if self.display_name is None:
+            self.display_name = self.cli_tool
 
     @abstractmethod
     def get_cli_tool_name(self) -> str:
@@ -21,11 +42,19 @@ class BaseProvider(ABC):
 
     def get_display_name(self) -> str:
         """Return user-facing display name for this provider.
-        
-        Override in subclasses if display name differs from CLI tool name.
-        For example, the 'agent' CLI tool displays as 'cursor' to users.
+
+        Set the display_name class attribute in subclasses if the display
+        name differs from the CLI tool name (resolved once in __init__).
+        """
+        return self.display_name
+
+    def __str__(self) -> str:
+        """Return the user-facing display name.
+
+        Lets callers format provider lists with map(str, providers)
+        instead of per-element method lookups.
         """
-        return self.cli_tool
+        return self.get_display_name()
 
     @abstractmethod
     def get_command(self, prompt: str, workspace: Path) -> list[str]:
@@ -1,23 +1,20 @@
 """Cursor agent provider."""
 
-import json
 from pathlib import Path
 from typing import Optional
 
-from ralph.providers.base import BaseProvider
+from ralph.providers.base import BaseProvider, json_loads
 
 
 class CursorProvider(BaseProvider):
     """Provider for Cursor agent CLI."""
 
+    display_name = "cursor"
+
     def get_cli_tool_name(self) -> str:
         """Return CLI tool name."""
         return "agent"
 
-    def get_display_name(self) -> str:
-        """Return user-facing display name."""
-        return "cursor"
-
     def get_command(self, prompt: str, workspace: Path) -> list[str]:
         """Return command to run agent CLI."""
         # Workspace is handled via subprocess cwd parameter, not command flag
@@ -35,7 +32,7 @@ class CursorProvider(BaseProvider):
             return None
         
         try:
-            data = json.loads(line)
+            data = json_loads(line)
             return data
-        except json.JSONDecodeError:
+        except ValueError:
             return None
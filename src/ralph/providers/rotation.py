@@ -45,7 +45,7 @@ class ProviderRotation:
             "rotate() completed",
             {
                 "current_index_after": self.current_index,
-                "new_provider_cli": result.cli_tool if hasattr(result, 'cli_tool') else str(type(result).__name__),
+                "new_provider_cli": result.cli_tool,
                 "next_index_calc": f"({self.current_index - 1} + 1) % {len(self.providers)} = {self.current_index}"
             },
             "D"
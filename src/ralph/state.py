@@ -98,6 +98,45 @@ def log_progress(workspace: Path, message: str) -> None:
         f.write(f"{message}\n")
 
 
+class ProgressBatch:
+    """Accumulate progress entries and flush them in one append.
+
+    Consecutive log_progress calls each open, append, and close
+    progress.md; batching them writes the whole group through a single
+    open/write cycle. Entries keep their own timestamps.
+    """
+
+    def __init__(self, workspace: Path):
+        self.workspace = workspace
+        self.entries: list[str] = []
+
+    def log(self, message: str) -> None:
+        """Queue a progress entry (timestamped now, written on flush)."""
+        from datetime import datetime
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.entries.append(f"\n### {timestamp}\n{message}\n")
+
+    def flush(self) -> None:
+        """Write all queued entries in one append."""
+        if self.entries:
+            progress_file = self.workspace / ".ralph" / "progress.md"
+            with progress_file.open("a", encoding="utf-8") as f:
+                f.writelines(self.entries)
+            self.entries.clear()
+
+    def __enter__(self) -> "ProgressBatch":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
+
+
+def progress_batch(workspace: Path) -> ProgressBatch:
+    """Create a ProgressBatch context manager for workspace."""
+    return ProgressBatch(workspace)
+
+
 def log_error(workspace: Path, message: str) -> None:
     """Log error to errors.log."""
     from datetime import datetime
@@ -1,53 +1,93 @@
 """Task file parsing and management."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 from ralph.parser import parse_frontmatter
 
+# Match checkbox list items: "- [ ]", "* [x]", "1. [ ]", etc.
+# Use \s instead of [[:space:]] to avoid nested character class warning
+# Group 3 captures the criterion text, if any
+_CHECKBOX_PATTERN = re.compile(r"^\s*([-*]|[0-9]+\.)\s+\[([ x])\](?:\s+(.+))?$")
 
-def parse_task_file(task_file: Path) -> Dict:
-    """Parse RALPH_TASK.md file (frontmatter + markdown)."""
-    content = task_file.read_text(encoding="utf-8")
-    frontmatter, body = parse_frontmatter(content)
-    
-    return {
-        "frontmatter": frontmatter,
-        "body": body,
-        "path": task_file,
-    }
 
+def _scan_criteria(content: str) -> Tuple[int, int, List[Tuple[str, bool]]]:
+    """Scan content once for checkboxes. Returns (done, total, criteria).
 
-def count_criteria(task_file: Path) -> Tuple[int, int]:
-    """Count checkboxes in task file. Returns (done, total)."""
-    content = task_file.read_text(encoding="utf-8")
-    
-    # Match checkbox list items: "- [ ]", "* [x]", "1. [ ]", etc.
-    # Use \s instead of [[:space:]] to avoid nested character class warning
-    checkbox_pattern = r"^\s*([-*]|[0-9]+\.)\s+\[([ x])\]"
-    
+    criteria is a list of (text, is_checked) tuples for checkboxes that
+    have text after the marker.
+    """
     total = 0
     done = 0
-    
+    criteria = []
+
     for line in content.splitlines():
-        match = re.match(checkbox_pattern, line)
+        match = _CHECKBOX_PATTERN.match(line)
         if match:
             total += 1
-            if match.group(2) == "x":
+            is_checked = match.group(2) == "x"
+            if is_checked:
                 done += 1
-    
-    return (done, total)
+            text = match.group(3)
+            if text:
+                criteria.append((text.strip(), is_checked))
 
+    return (done, total, criteria)
 
-def check_completion(task_file: Path) -> str:
-    """Check if task is complete. Returns 'COMPLETE' or 'INCOMPLETE:N'."""
-    done, total = count_criteria(task_file)
-    
+
+def _completion_status(done: int, total: int) -> str:
+    """Derive completion status string from criteria counts."""
     if total == 0:
         return "NO_CRITERIA"
-    
+
     if done == total:
         return "COMPLETE"
-    
+
     return f"INCOMPLETE:{total - done}"
+
+
+@lru_cache(maxsize=8)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> Dict:
+    """Read and parse a task file, cached by (path, mtime, size)."""
+    task_file = Path(path_str)
+    content = task_file.read_text(encoding="utf-8")
+    frontmatter, body = parse_frontmatter(content)
+    done, total, criteria = _scan_criteria(content)
+
+    return {
+        "frontmatter": frontmatter,
+        "body": body,
+        "path": task_file,
+        "done": done,
+        "total": total,
+        "completion_status": _completion_status(done, total),
+        "criteria": criteria,
+    }
+
+
+def parse_task_file(task_file: Path) -> Dict:
+    """Parse RALPH_TASK.md file (frontmatter + markdown).
+
+    Reads the file once and precomputes criteria information, so callers
+    don't need follow-up count_criteria/check_completion reads:
+    "done"/"total" are checkbox counts, "completion_status" matches
+    check_completion, and "criteria" is a list of (text, is_checked)
+    tuples. Results are cached by mtime and size, so re-parsing an
+    unchanged file costs one stat (size catches rewrites on filesystems
+    with coarse mtime resolution).
+    """
+    st = task_file.stat()
+    return _parse_cached(str(task_file), st.st_mtime_ns, st.st_size)
+
+
+def count_criteria(task_file: Path) -> Tuple[int, int]:
+    """Count checkboxes in task file. Returns (done, total)."""
+    task_data = parse_task_file(task_file)
+    return (task_data["done"], task_data["total"])
+
+
+def check_completion(task_file: Path) -> str:
+    """Check if task is complete. Returns 'COMPLETE' or 'INCOMPLETE:N'."""
+    return parse_task_file(task_file)["completion_status"]
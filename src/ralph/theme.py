@@ -0,0 +1,16 @@
+"""Color theme for Ralph CLI output.
+
+A pure literal with no dependencies, so commands that only need colors
+(e.g. error panels on the run path) don't pull in the full UI module.
+"""
+
+# Consistent color theme
+THEME = {
+    "primary": "yellow",
+    "success": "green",
+    "warning": "yellow",
+    "error": "red",
+    "muted": "dim",
+    "accent": "magenta",
+    "info": "blue",
+}
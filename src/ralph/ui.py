@@ -20,17 +20,7 @@ from rich.text import Text
 from rich.markup import escape
 
 from ralph import tokens
-
-# Consistent color theme
-THEME = {
-    "primary": "yellow",
-    "success": "green",
-    "warning": "yellow",
-    "error": "red",
-    "muted": "dim",
-    "accent": "magenta",
-    "info": "blue",
-}
+from ralph.theme import THEME
 
 
 class RalphLiveDisplay:
@@ -240,26 +230,17 @@ class RalphLiveDisplay:
 
 
 def get_criteria_list(task_file: Path) -> List[Tuple[str, bool]]:
-    """Extract criteria from task file as list of (text, is_checked) tuples."""
-    import re
-    
+    """Extract criteria from task file as list of (text, is_checked) tuples.
+
+    Delegates to the mtime-cached task parser, so repeated calls on an
+    unchanged file (e.g. live-display refreshes) cost one stat.
+    """
+    from ralph import task
+
     if not task_file.exists():
         return []
-    
-    content = task_file.read_text(encoding="utf-8")
-    criteria = []
-    
-    # Match checkbox list items
-    checkbox_pattern = r"^\s*([-*]|[0-9]+\.)\s+\[([ x])\]\s+(.+)$"
-    
-    for line in content.splitlines():
-        match = re.match(checkbox_pattern, line)
-        if match:
-            is_checked = match.group(2) == "x"
-            text = match.group(3).strip()
-            criteria.append((text, is_checked))
-    
-    return criteria
+
+    return task.parse_task_file(task_file)["criteria"]
 
 
 def print_header(console: Console, title: str = "Ralph") -> None:
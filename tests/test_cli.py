@@ -128,7 +128,15 @@ class TestRunCommandValidation:
     ) -> None:
         """Test --pr flag requires --branch to be specified."""
         mock_is_git_repo.return_value = True
-        mock_parse.return_value = {"frontmatter": {}, "body": "", "path": tmp_path / "RALPH_TASK.md"}
+        mock_parse.return_value = {
+            "frontmatter": {},
+            "body": "",
+            "path": tmp_path / "RALPH_TASK.md",
+            "done": 0,
+            "total": 1,
+            "completion_status": "INCOMPLETE:1",
+            "criteria": [("Test", False)],
+        }
 
         # Create task file
         task_file = tmp_path / "RALPH_TASK.md"
@@ -19,34 +19,40 @@ from ralph.git_utils import (
 class TestIsGitRepo:
     """Tests for is_git_repo function."""
 
-    @patch("subprocess.run")
-    def test_returns_true_for_git_repo(self, mock_run: MagicMock) -> None:
-        """Test returns True for valid git repository."""
-        mock_run.return_value = MagicMock(returncode=0)
+    def test_returns_true_for_git_repo(self, tmp_path: Path) -> None:
+        """Test returns True when a .git directory is present."""
+        (tmp_path / ".git").mkdir()
 
-        result = is_git_repo(Path("/some/repo"))
+        result = is_git_repo(tmp_path)
 
         assert result is True
-        mock_run.assert_called_once()
-        assert "rev-parse" in mock_run.call_args[0][0]
 
-    @patch("subprocess.run")
-    def test_returns_false_for_non_git_directory(self, mock_run: MagicMock) -> None:
-        """Test returns False for non-git directory."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+    def test_returns_true_for_bare_repo_layout(self, tmp_path: Path) -> None:
+        """Test returns True for a bare repository (objects/ + refs/)."""
+        (tmp_path / "objects").mkdir()
+        (tmp_path / "refs").mkdir()
 
-        result = is_git_repo(Path("/not/a/repo"))
+        result = is_git_repo(tmp_path)
+
+        assert result is True
+
+    def test_returns_false_for_non_git_directory(self, tmp_path: Path) -> None:
+        """Test returns False for non-git directory."""
+        result = is_git_repo(tmp_path)
 
         assert result is False
 
+    @patch.dict("os.environ", {"RALPH_STRICT_GIT_CHECK": "1"})
     @patch("subprocess.run")
-    def test_returns_false_when_git_not_installed(self, mock_run: MagicMock) -> None:
-        """Test returns False when git is not installed."""
-        mock_run.side_effect = FileNotFoundError()
+    def test_strict_mode_shells_out_to_git(self, mock_run: MagicMock, tmp_path: Path) -> None:
+        """Test strict mode uses git rev-parse instead of the heuristic."""
+        mock_run.return_value = MagicMock(returncode=0)
 
-        result = is_git_repo(Path("/some/path"))
+        result = is_git_repo(tmp_path)
 
-        assert result is False
+        assert result is True
+        mock_run.assert_called_once()
+        assert "rev-parse" in mock_run.call_args[0][0]
 
 
 class TestCreateBranch:
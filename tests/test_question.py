@@ -108,11 +108,11 @@ class TestDisplayQuestionPanel:
 class TestWaitForUserInputWithTimeout:
     """Tests for wait_for_user_input_with_timeout function."""
 
-    @patch("select.select")
+    @patch("selectors.DefaultSelector")
     @patch("sys.stdin")
-    def test_returns_input_when_available(self, mock_stdin, mock_select) -> None:
+    def test_returns_input_when_available(self, mock_stdin, mock_selector_cls) -> None:
         """Test returns user input when available before timeout."""
-        mock_select.return_value = ([mock_stdin], [], [])
+        mock_selector_cls.return_value.select.return_value = [MagicMock()]
         mock_stdin.readline.return_value = "postgresql\n"
         
         with patch("ralph.interview_turns.console"):
@@ -120,21 +120,21 @@ class TestWaitForUserInputWithTimeout:
         
         assert result == "postgresql"
 
-    @patch("select.select")
-    def test_returns_none_on_timeout(self, mock_select) -> None:
+    @patch("selectors.DefaultSelector")
+    def test_returns_none_on_timeout(self, mock_selector_cls) -> None:
         """Test returns None when timeout reached."""
-        mock_select.return_value = ([], [], [])  # No input ready
+        mock_selector_cls.return_value.select.return_value = []  # No input ready
         
         with patch("ralph.interview_turns.console"):
             result = wait_for_user_input_with_timeout(timeout=1)
         
         assert result is None
 
-    @patch("select.select")
+    @patch("selectors.DefaultSelector")
     @patch("sys.stdin")
-    def test_returns_none_for_empty_input(self, mock_stdin, mock_select) -> None:
+    def test_returns_none_for_empty_input(self, mock_stdin, mock_selector_cls) -> None:
         """Test returns None when user enters empty string."""
-        mock_select.return_value = ([mock_stdin], [], [])
+        mock_selector_cls.return_value.select.return_value = [MagicMock()]
         mock_stdin.readline.return_value = "\n"  # Empty input
         
         with patch("ralph.interview_turns.console"):
@@ -142,10 +142,10 @@ class TestWaitForUserInputWithTimeout:
         
         assert result is None
 
-    @patch("select.select")
-    def test_returns_none_on_keyboard_interrupt(self, mock_select) -> None:
+    @patch("selectors.DefaultSelector")
+    def test_returns_none_on_keyboard_interrupt(self, mock_selector_cls) -> None:
         """Test returns None on keyboard interrupt."""
-        mock_select.side_effect = KeyboardInterrupt()
+        mock_selector_cls.return_value.select.side_effect = KeyboardInterrupt()
         
         with patch("ralph.interview_turns.console"):
             result = wait_for_user_input_with_timeout(timeout=60)